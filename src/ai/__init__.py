@@ -1,4 +1,4 @@
 """AI provider implementations - generic LLM interface."""
-from .ai_provider import AIProvider
+from .ai_provider import AIProvider, user_content_blocks
 
-__all__ = ['AIProvider']
+__all__ = ['AIProvider', 'user_content_blocks']
@@ -7,9 +7,36 @@ It accepts structured prompts that can be cached by LLM backends.
 Supports multiple backends: AWS Bedrock, OpenAI, Anthropic, local models, etc.
 """
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
 
 from src.domain.models import AIPrompt
 
+_DEFAULT_MAX_WORKERS = 8
+
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def user_content_blocks(prompt: AIPrompt) -> list[dict[str, Any]]:
+    """Build Claude Messages API user content blocks for *prompt*.
+
+    The character registry gets its own block with a ``cache_control``
+    breakpoint, so consecutive sections that share a registry read it (and
+    the static system prompt before it) from the prompt cache.  The rest of
+    the dynamic portion follows uncached.  An empty registry gets no block.
+    """
+    blocks: list[dict[str, Any]] = []
+    if prompt.character_registry:
+        blocks.append({
+            "type": "text",
+            "text": prompt.character_registry,
+            "cache_control": _EPHEMERAL_CACHE,
+        })
+    volatile = prompt.build_volatile_portion()
+    if volatile or not blocks:
+        blocks.append({"type": "text", "text": volatile})
+    return blocks
+
 
 class AIProvider(ABC):
     """Abstract base class for AI providers.
@@ -35,3 +62,45 @@ class AIProvider(ABC):
             Exception: If the API call fails
         """
         pass
+
+    def generate_many(
+        self,
+        prompts: Sequence[AIPrompt],
+        max_tokens: int = 1000,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> list[str]:
+        """Generate responses for several independent prompts concurrently.
+
+        The default implementation fans ``generate`` out over a thread pool;
+        provider calls are network-bound, so the round-trips overlap instead
+        of running back to back.  Only use this for prompts that do not
+        depend on each other's results.
+
+        Args:
+            prompts: The structured prompts to send to the model
+            max_tokens: Maximum tokens in each response (default: 1000)
+            max_workers: Upper bound on concurrent requests (default: 8)
+
+        Returns:
+            The model's response texts, in the same order as ``prompts``
+
+        Raises:
+            Exception: If any API call fails
+        """
+        if len(prompts) <= 1:
+            return [self.generate(prompt, max_tokens=max_tokens) for prompt in prompts]
+        workers = min(max_workers, len(prompts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda p: self.generate(p, max_tokens=max_tokens), prompts))
+
+    def invalidate(self, prompt: AIPrompt, max_tokens: int = 1000) -> None:
+        """Forget any stored response for *prompt*.
+
+        Callers invoke this when a response turns out to be unusable (e.g.
+        it fails to parse) so a caching provider does not replay it.  The
+        default implementation stores nothing and does nothing.
+
+        Args:
+            prompt: The structured prompt whose response was rejected
+            max_tokens: The ``max_tokens`` the response was generated with
+        """
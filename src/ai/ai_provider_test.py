@@ -83,3 +83,36 @@ class TestAIProviderAcceptsAIPrompt:
 
         # Assert
         assert provider.last_max_tokens == 1000
+
+
+class _EchoAIProvider(AIProvider):
+    """Echoes the text to parse back so results can be matched to prompts."""
+
+    def generate(self, prompt: AIPrompt, max_tokens: int = 1000) -> str:
+        return prompt.text_to_parse
+
+
+class TestGenerateMany:
+    """Tests for the default concurrent AIProvider.generate_many."""
+
+    def test_generate_many_preserves_prompt_order(self) -> None:
+        """Responses are returned in the same order as the prompts."""
+        # Arrange
+        prompts = [
+            AIPrompt(
+                static_instructions="S",
+                book_context="",
+                character_registry="",
+                surrounding_context="",
+                scene_registry="",
+                text_to_parse=str(i),
+            )
+            for i in range(20)
+        ]
+        provider = _EchoAIProvider()
+
+        # Act
+        responses = provider.generate_many(prompts, max_tokens=10, max_workers=4)
+
+        # Assert
+        assert responses == [str(i) for i in range(20)]
@@ -1,12 +1,12 @@
 """Anthropic direct API provider using the anthropic Python SDK."""
-from typing import Optional, cast
+from typing import Any, Optional, cast
 
 import anthropic
 from anthropic.types import TextBlock
 
 from ..config import Config
 from ..domain.models import AIPrompt
-from .ai_provider import AIProvider
+from .ai_provider import AIProvider, user_content_blocks
 from .token_tracker import TokenTracker
 
 
@@ -54,9 +54,10 @@ class AnthropicProvider(AIProvider):
 
         Token usage reported in the response is recorded in :attr:`token_tracker`.
 
-        Prompt caching is applied: the static portion of the prompt is marked
-        with ``cache_control`` so that subsequent calls with identical static
-        sections pay reduced token costs (Anthropic's prompt caching feature).
+        Prompt caching is applied: the static portion of the prompt and the
+        character registry are marked with ``cache_control`` so that
+        subsequent calls with identical prefixes pay reduced token costs
+        (Anthropic's prompt caching feature).
 
         Args:
             prompt: The structured AIPrompt to send to the model.
@@ -69,7 +70,6 @@ class AnthropicProvider(AIProvider):
             Exception: If the API call fails.
         """
         static_portion = prompt.build_static_portion()
-        dynamic_portion = prompt.build_dynamic_portion()
 
         response = self._client.messages.create(
             model=self.model_id,
@@ -84,7 +84,7 @@ class AnthropicProvider(AIProvider):
             messages=[
                 {
                     "role": "user",
-                    "content": dynamic_portion,
+                    "content": cast(Any, user_content_blocks(prompt)),
                 }
             ],
         )
@@ -106,6 +106,34 @@ class TestAnthropicProviderGenerate:
         assert "MY_STATIC_INSTRUCTIONS" in static_block["text"]
         assert static_block["cache_control"] == {"type": "ephemeral"}
 
+    def test_user_blocks_put_cache_breakpoint_after_registry(self) -> None:
+        """generate() sends the registry as a cached block, then the uncached rest."""
+        config = _make_config()
+        fake_response = _make_sdk_response("ok", input_tokens=5, output_tokens=2)
+        prompt = AIPrompt(
+            static_instructions="STATIC",
+            book_context="",
+            character_registry="REGISTRY",
+            surrounding_context="CTX",
+            scene_registry="",
+            text_to_parse="TEXT",
+        )
+
+        with patch("src.ai.anthropic_provider.anthropic.Anthropic") as mock_anthropic_cls:
+            mock_client = MagicMock()
+            mock_anthropic_cls.return_value = mock_client
+            mock_client.messages.create.return_value = fake_response
+
+            provider = AnthropicProvider(config)
+            provider.generate(prompt, max_tokens=50)
+
+        messages = mock_client.messages.create.call_args.kwargs["messages"]
+        assert messages[0]["role"] == "user"
+        assert messages[0]["content"] == [
+            {"type": "text", "text": "REGISTRY", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "CTXTEXT"},
+        ]
+
 
 class TestAnthropicProviderDefaultTracker:
     """AnthropicProvider creates its own TokenTracker when none is provided."""
@@ -1,20 +1,75 @@
 """AWS Bedrock AI provider implementation using Claude models."""
-import json
-from typing import Optional
+import functools
+from typing import Any, Optional
 
 import boto3
+import orjson
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, ReadTimeoutError
 
 from ..config import Config
 from ..domain.models import AIPrompt
-from .ai_provider import AIProvider
+from .ai_provider import AIProvider, user_content_blocks
 from .token_tracker import TokenTracker
 
 # Bedrock read timeout in seconds. Large sections (e.g., multi-page letters)
 # can take well over the default 60 seconds to process.
 _BEDROCK_READ_TIMEOUT_SECONDS = 300
 
+# Connection settings for the Bedrock runtime client. Keep-alive and a pool
+# sized for concurrent generate_many() calls let requests reuse the same
+# TLS connections instead of re-handshaking on each call. Adaptive retries
+# back off client-side when Bedrock throttles, and a short connect timeout
+# fails fast on an unreachable endpoint instead of waiting the default 60s.
+_BEDROCK_CONNECT_TIMEOUT_SECONDS = 5
+_BEDROCK_MAX_POOL_CONNECTIONS = 32
+_BEDROCK_MAX_ATTEMPTS = 3
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(
+    region: str,
+    access_key_id: Optional[str],
+    secret_access_key: Optional[str],
+    session_token: Optional[str],
+) -> Any:
+    """Build a Bedrock runtime client, shared by providers with the same settings.
+
+    Creating a boto3 session loads credentials and resolves endpoints, so
+    providers reuse one client (and its connection pool) per configuration.
+
+    Args:
+        region: AWS region name
+        access_key_id: Explicit access key, or None for the default chain
+        secret_access_key: Explicit secret key, or None for the default chain
+        session_token: Optional session token for temporary credentials
+
+    Returns:
+        A boto3 ``bedrock-runtime`` client
+    """
+    # Add credentials if provided (otherwise uses default credential chain)
+    if access_key_id and secret_access_key:
+        session = boto3.Session(
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            aws_session_token=session_token,
+            region_name=region,
+        )
+    else:
+        session = boto3.Session(region_name=region)
+
+    # Configure increased read timeout for large section processing, and
+    # keep connections alive so consecutive calls skip the TLS handshake
+    boto_config = BotoConfig(
+        read_timeout=_BEDROCK_READ_TIMEOUT_SECONDS,
+        connect_timeout=_BEDROCK_CONNECT_TIMEOUT_SECONDS,
+        tcp_keepalive=True,
+        max_pool_connections=_BEDROCK_MAX_POOL_CONNECTIONS,
+        retries={'max_attempts': _BEDROCK_MAX_ATTEMPTS, 'mode': 'adaptive'},
+    )
+
+    return session.client('bedrock-runtime', config=boto_config)
+
 
 class AWSBedrockProvider(AIProvider):
     """AI provider using AWS Bedrock with Claude models.
@@ -50,31 +105,23 @@ class AWSBedrockProvider(AIProvider):
         # Initialize boto3 client
         self._new_client()
 
-    def _new_client(self) -> None:
-        """Recreate the boto3 Bedrock client.
+    def _new_client(self, refresh: bool = False) -> None:
+        """Attach the shared boto3 Bedrock client for this provider's settings.
 
-        This is called on initialization and when credentials expire to refresh
-        the session and client.
-        """
-        # Add credentials if provided (otherwise uses default credential chain)
-        if self.config.aws.access_key_id and self.config.aws.secret_access_key:
-            session = boto3.Session(
-                aws_access_key_id=self.config.aws.access_key_id,
-                aws_secret_access_key=self.config.aws.secret_access_key,
-                aws_session_token=self.config.aws.session_token,
-                region_name=self.config.aws.region,
-            )
-        else:
-            session = boto3.Session(region_name=self.config.aws.region)
+        This is called on initialization and when credentials expire. On
+        refresh the shared client cache is cleared so a new session picks up
+        fresh credentials.
 
-        # Configure increased read timeout for large section processing
-        boto_config = BotoConfig(
-            read_timeout=_BEDROCK_READ_TIMEOUT_SECONDS
+        Args:
+            refresh: Discard cached clients and build a new one.
+        """
+        if refresh:
+            _get_client.cache_clear()
+        aws = self.config.aws
+        self.bedrock_runtime = _get_client(
+            aws.region, aws.access_key_id, aws.secret_access_key, aws.session_token,
         )
 
-        self.bedrock_runtime = session.client('bedrock-runtime', config=boto_config)
-
-
     def _build_cached_request_body(
         self, prompt: AIPrompt, max_tokens: int
     ) -> dict:
@@ -83,7 +130,9 @@ class AWSBedrockProvider(AIProvider):
         Uses AIPrompt's build_static_portion() and build_dynamic_portion() methods
         to beat the prompt cleanly. The static portion is marked with cache_control
         so that subsequent calls with identical static sections pay 90% less for
-        those tokens (Bedrock's prompt caching feature).
+        those tokens (Bedrock's prompt caching feature). A second breakpoint
+        after the character registry lets consecutive sections that share a
+        registry reuse it from the cache as well.
 
         Args:
             prompt: The structured AIPrompt object
@@ -91,9 +140,9 @@ class AWSBedrockProvider(AIProvider):
 
         Returns:
             A Bedrock request body dict with cache_control on the static portion
+            and the character registry
         """
         static_portion = prompt.build_static_portion()
-        dynamic_portion = prompt.build_dynamic_portion()
 
         # Update cache tracking
         self._cached_static_portion = static_portion
@@ -112,7 +161,7 @@ class AWSBedrockProvider(AIProvider):
             "messages": [
                 {
                     "role": "user",
-                    "content": dynamic_portion
+                    "content": user_content_blocks(prompt)
                 }
             ]
         }
@@ -151,10 +200,10 @@ class AWSBedrockProvider(AIProvider):
         try:
             response = self.bedrock_runtime.invoke_model(
                 modelId=self.model_id,
-                body=json.dumps(request_body)
+                body=orjson.dumps(request_body)
             )
 
-            response_body = json.loads(response['body'].read())
+            response_body = orjson.loads(response['body'].read())
 
             # Extract token usage reported by Bedrock (present for Claude models)
             usage = response_body.get("usage", {})
@@ -180,14 +229,14 @@ class AWSBedrockProvider(AIProvider):
             error_message = str(e)
             if "ExpiredTokenException" in error_message:
                 # Refresh the client and retry once
-                self._new_client()
+                self._new_client(refresh=True)
                 try:
                     response = self.bedrock_runtime.invoke_model(
                         modelId=self.model_id,
-                        body=json.dumps(request_body)
+                        body=orjson.dumps(request_body)
                     )
 
-                    response_body = json.loads(response['body'].read())
+                    response_body = orjson.loads(response['body'].read())
 
                     # Extract token usage reported by Bedrock
                     usage = response_body.get("usage", {})
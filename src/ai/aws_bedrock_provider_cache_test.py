@@ -5,11 +5,19 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from botocore.exceptions import ClientError
 
-from src.ai.aws_bedrock_provider import AWSBedrockProvider
+from src.ai.aws_bedrock_provider import AWSBedrockProvider, _get_client
 from src.config import AWSConfig, Config
 from src.domain.models import AIPrompt
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop shared Bedrock clients so each test sees its own patched session."""
+    _get_client.cache_clear()
+    yield
+    _get_client.cache_clear()
+
+
 @pytest.fixture
 def mock_config() -> Config:
     """Create a mock config for testing."""
@@ -251,6 +259,43 @@ class TestBedrockPromptCaching:
             # Cache control should be on system, not messages
             assert body['system'][0].get('cache_control', {}).get('type') == 'ephemeral'
 
+    def test_character_registry_gets_its_own_cache_breakpoint(self, mock_config):
+        """Verify the registry is a cached user block ahead of the per-section text."""
+        # Arrange
+        test_prompt = AIPrompt(
+            static_instructions="Rules: Break down text.",
+            book_context="",
+            character_registry="  - character_id: \"narrator\"\n",
+            surrounding_context="CTX",
+            scene_registry="",
+            text_to_parse="content"
+        )
+
+        captured_requests = []
+
+        def capture_invoke_model(*args, **kwargs):
+            captured_requests.append(json.loads(kwargs['body']))
+            return create_success_response()
+
+        with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
+            mock_client = Mock()
+            mock_client.invoke_model = Mock(side_effect=capture_invoke_model)
+            mock_session_class.return_value.client.return_value = mock_client
+
+            provider = AWSBedrockProvider(mock_config)
+
+            # Act
+            provider.generate(test_prompt)
+
+            # Assert
+            content = captured_requests[0]['messages'][0]['content']
+            assert content[0] == {
+                "type": "text",
+                "text": test_prompt.character_registry,
+                "cache_control": {"type": "ephemeral"},
+            }
+            assert content[1] == {"type": "text", "text": "CTXcontent"}
+
     def test_expired_token_exception_still_works_with_caching(self, mock_config):
         """Verify token expiry retry still works with caching enabled."""
         # Arrange
@@ -8,11 +8,33 @@ from botocore.exceptions import (
     ReadTimeoutError,
 )
 
-from src.ai.aws_bedrock_provider import AWSBedrockProvider
+from src.ai.aws_bedrock_provider import AWSBedrockProvider, _get_client
 from src.config import AWSConfig, Config
 from src.domain.models import AIPrompt
 
 
+@pytest.fixture(scope="module")
+def mock_session_class():
+    """Patch ``boto3.Session`` once for the whole module."""
+    patcher = patch('src.ai.aws_bedrock_provider.boto3.Session')
+    session_class = patcher.start()
+    yield session_class
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def mock_bedrock_client(mock_session_class):
+    """Return a fresh Bedrock client mock for each test.
+
+    Resets the module-scoped session patch and drops shared Bedrock clients
+    so no test sees another's side effects or call counts.
+    """
+    mock_session_class.reset_mock(return_value=True, side_effect=True)
+    _get_client.cache_clear()
+    yield mock_session_class.return_value.client.return_value
+    _get_client.cache_clear()
+
+
 @pytest.fixture
 def mock_config() -> Config:
     """Create a mock config for testing."""
@@ -45,7 +67,9 @@ def success_response():
 class TestAWSBedrockProviderCredentialRefresh:
     """Tests for credential refresh on token expiry."""
 
-    def test_expired_token_exception_triggers_retry_and_succeeds(self, mock_config, success_response):
+    def test_expired_token_exception_triggers_retry_and_succeeds(
+        self, mock_config, mock_bedrock_client, success_response
+    ):
         """Verify that ExpiredTokenException triggers retry and eventually succeeds."""
         # Arrange
         prompt = AIPrompt(
@@ -66,22 +90,17 @@ class TestAWSBedrockProviderCredentialRefresh:
                 raise ClientError(error_response, 'InvokeModel')
             return success_response
 
-        with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
-            mock_client = Mock()
-            mock_client.invoke_model = Mock(side_effect=invoke_model_side_effect)
-            mock_session = Mock()
-            mock_session.client.return_value = mock_client
-            mock_session_class.return_value = mock_session
+        mock_bedrock_client.invoke_model.side_effect = invoke_model_side_effect
 
-            # Act
-            provider = AWSBedrockProvider(mock_config)
-            response = provider.generate(prompt)
+        # Act
+        provider = AWSBedrockProvider(mock_config)
+        response = provider.generate(prompt)
 
-            # Assert
-            assert response == "Success response"
-            assert mock_client.invoke_model.call_count == 2
+        # Assert
+        assert response == "Success response"
+        assert mock_bedrock_client.invoke_model.call_count == 2
 
-    def test_non_expired_errors_raise_immediately(self, mock_config):
+    def test_non_expired_errors_raise_immediately(self, mock_config, mock_bedrock_client):
         """Verify that non-ExpiredTokenException errors raise immediately without retry."""
         # Arrange
         prompt = AIPrompt(
@@ -92,27 +111,22 @@ class TestAWSBedrockProviderCredentialRefresh:
             scene_registry="",
             text_to_parse=""
         )
-        with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
-            mock_client = Mock()
-            mock_client.invoke_model = Mock(side_effect=ClientError(
-                {'Error': {'Code': 'ValidationException', 'Message': 'Invalid request'}},
-                'InvokeModel'
-            ))
-            mock_session = Mock()
-            mock_session.client.return_value = mock_client
-            mock_session_class.return_value = mock_session
-
-            provider = AWSBedrockProvider(mock_config)
-
-            # Act & Assert
-            with pytest.raises(Exception) as exc_info:
-                provider.generate(prompt)
-
-            assert "AWS Bedrock API error" in str(exc_info.value)
-            # Should only be called once (no retry)
-            assert mock_client.invoke_model.call_count == 1
-
-    def test_expired_token_retried_but_fails_on_retry(self, mock_config):
+        mock_bedrock_client.invoke_model.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'Invalid request'}},
+            'InvokeModel'
+        )
+
+        provider = AWSBedrockProvider(mock_config)
+
+        # Act & Assert
+        with pytest.raises(Exception) as exc_info:
+            provider.generate(prompt)
+
+        assert "AWS Bedrock API error" in str(exc_info.value)
+        # Should only be called once (no retry)
+        assert mock_bedrock_client.invoke_model.call_count == 1
+
+    def test_expired_token_retried_but_fails_on_retry(self, mock_config, mock_bedrock_client):
         """Verify that if retry also fails, error is raised."""
         # Arrange
         prompt = AIPrompt(
@@ -123,71 +137,79 @@ class TestAWSBedrockProviderCredentialRefresh:
             scene_registry="",
             text_to_parse=""
         )
-        with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
-            mock_client = Mock()
-            mock_client.invoke_model = Mock(side_effect=ClientError(
-                {'Error': {'Code': 'ValidationException', 'Message': 'ExpiredTokenException'}},
-                'InvokeModel'
-            ))
-            mock_session = Mock()
-            mock_session.client.return_value = mock_client
-            mock_session_class.return_value = mock_session
-
-            provider = AWSBedrockProvider(mock_config)
-
-            # Act & Assert
-            with pytest.raises(Exception) as exc_info:
-                provider.generate(prompt)
-
-            assert "AWS Bedrock API error" in str(exc_info.value)
-            # Should be called twice (initial call + one retry)
-            assert mock_client.invoke_model.call_count == 2
-
-    def test_new_client_method_exists_and_recreates_session(self, mock_config):
-        """Verify _new_client method exists and can be called."""
-        # Arrange
-        with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
-            mock_client = Mock()
-            mock_session = Mock()
-            mock_session.client.return_value = mock_client
-            mock_session_class.return_value = mock_session
+        mock_bedrock_client.invoke_model.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'ExpiredTokenException'}},
+            'InvokeModel'
+        )
 
-            provider = AWSBedrockProvider(mock_config)
+        provider = AWSBedrockProvider(mock_config)
 
-            # Act
-            provider._new_client()
+        # Act & Assert
+        with pytest.raises(Exception) as exc_info:
+            provider.generate(prompt)
 
-            # Assert
-            assert provider.bedrock_runtime is not None
-            # Session constructor should have been called at least twice (init + _new_client)
-            assert mock_session_class.call_count >= 1
+        assert "AWS Bedrock API error" in str(exc_info.value)
+        # Should be called twice (initial call + one retry)
+        assert mock_bedrock_client.invoke_model.call_count == 2
 
+    def test_providers_with_same_config_share_one_client(self, mock_config, mock_session_class):
+        """Verify the boto3 session is built once and reused across instances."""
+        # Act
+        first = AWSBedrockProvider(mock_config)
+        second = AWSBedrockProvider(mock_config)
 
-def test_bedrock_client_configured_with_read_timeout(mock_config):
-    """Verify that boto3 client is created with 300-second read timeout."""
-    # Arrange
-    with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
-        mock_client = Mock()
-        mock_session = Mock()
-        mock_session.client.return_value = mock_client
-        mock_session_class.return_value = mock_session
+        # Assert
+        assert first.bedrock_runtime is second.bedrock_runtime
+        assert mock_session_class.call_count == 1
 
-        # Act
+    def test_new_client_refresh_clears_shared_client_and_recreates_session(
+        self, mock_config, mock_session_class,
+    ):
+        """_new_client(refresh=True) drops the shared client and builds a new Session."""
+        # Arrange
         provider = AWSBedrockProvider(mock_config)
+        assert mock_session_class.call_count == 1
+
+        # Act
+        provider._new_client(refresh=True)
 
         # Assert
         assert provider.bedrock_runtime is not None
-        # Verify session.client() was called with a config argument
-        call_args = mock_session.client.call_args
-        assert call_args is not None
-        config_arg = call_args.kwargs.get('config')
-        assert config_arg is not None, "Expected 'config' kwarg in session.client() call"
-        # Verify the config has read_timeout set to 300
-        assert hasattr(config_arg, 'read_timeout'), "Config object missing read_timeout attribute"
-        assert config_arg.read_timeout == 300, f"Expected read_timeout=300, got {config_arg.read_timeout}"
+        # One Session from __init__, and a second after the cache was cleared
+        assert mock_session_class.call_count == 2
 
 
-def test_read_timeout_error_raises_descriptive_exception(mock_config):
+def test_bedrock_client_configured_with_read_timeout(mock_config, mock_session_class):
+    """Verify that boto3 client is created with 300-second read timeout."""
+    # Act
+    provider = AWSBedrockProvider(mock_config)
+
+    # Assert
+    assert provider.bedrock_runtime is not None
+    # Verify session.client() was called with a config argument
+    call_args = mock_session_class.return_value.client.call_args
+    assert call_args is not None
+    config_arg = call_args.kwargs.get('config')
+    assert config_arg is not None, "Expected 'config' kwarg in session.client() call"
+    # Verify the config has read_timeout set to 300
+    assert hasattr(config_arg, 'read_timeout'), "Config object missing read_timeout attribute"
+    assert config_arg.read_timeout == 300, f"Expected read_timeout=300, got {config_arg.read_timeout}"
+
+
+def test_bedrock_client_configured_for_pooling_retries_and_connect_timeout(mock_config, mock_session_class):
+    """Verify the connection pool, keep-alive, retry and connect-timeout settings."""
+    # Act
+    AWSBedrockProvider(mock_config)
+
+    # Assert
+    config_arg = mock_session_class.return_value.client.call_args.kwargs['config']
+    assert config_arg.tcp_keepalive is True
+    assert config_arg.max_pool_connections == 32
+    assert config_arg.connect_timeout == 5
+    assert config_arg.retries == {'max_attempts': 3, 'mode': 'adaptive'}
+
+
+def test_read_timeout_error_raises_descriptive_exception(mock_config, mock_bedrock_client):
     """Verify that ReadTimeoutError is caught and wrapped with descriptive message."""
     # Arrange
     prompt = AIPrompt(
@@ -198,20 +220,15 @@ def test_read_timeout_error_raises_descriptive_exception(mock_config):
         scene_registry="",
         text_to_parse=""
     )
-    with patch('src.ai.aws_bedrock_provider.boto3.Session') as mock_session_class:
-        mock_client = Mock()
-        # Simulate ReadTimeoutError from boto3
-        mock_client.invoke_model = Mock(side_effect=ReadTimeoutError(endpoint_url="https://bedrock.us-east-1.amazonaws.com"))
-        mock_session = Mock()
-        mock_session.client.return_value = mock_client
-        mock_session_class.return_value = mock_session
+    # Simulate ReadTimeoutError from boto3
+    mock_bedrock_client.invoke_model.side_effect = ReadTimeoutError(endpoint_url="https://bedrock.us-east-1.amazonaws.com")
 
-        provider = AWSBedrockProvider(mock_config)
+    provider = AWSBedrockProvider(mock_config)
 
-        # Act & Assert
-        with pytest.raises(Exception) as exc_info:
-            provider.generate(prompt)
+    # Act & Assert
+    with pytest.raises(Exception) as exc_info:
+        provider.generate(prompt)
 
-        error_message = str(exc_info.value)
-        assert "timeout" in error_message.lower(), f"Expected 'timeout' in error message: {error_message}"
-        assert "300" in error_message, f"Expected '300' in error message: {error_message}"
+    error_message = str(exc_info.value)
+    assert "timeout" in error_message.lower(), f"Expected 'timeout' in error message: {error_message}"
+    assert "300" in error_message, f"Expected '300' in error message: {error_message}"
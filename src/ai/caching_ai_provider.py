@@ -0,0 +1,280 @@
+"""Caching decorator for AI providers.
+
+Wraps any :class:`AIProvider` and memoizes responses by prompt so that
+re-running a book reuses earlier LLM output instead of paying for another
+round-trip. Entries live in a small in-memory LRU and are persisted to a
+size-capped disk cache so they survive across runs.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Sequence
+
+import structlog
+
+from src.domain.models import AIPrompt
+
+from .ai_provider import _DEFAULT_MAX_WORKERS, AIProvider
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_MAX_MEMORY_ENTRIES = 1000
+_DEFAULT_MAX_DISK_ENTRIES = 10_000
+
+
+class CachingAIProvider(AIProvider):
+    """AI provider decorator that caches responses in memory and on disk.
+
+    Cache keys are a 128-bit BLAKE2b digest of the wrapped provider's model
+    id, the full prompt and ``max_tokens``, so changing any of them is a
+    cache miss.
+    Disk entries older than ``ttl_seconds`` are ignored and regenerated.
+    Once a write takes the disk cache past ``max_disk_entries``, expired
+    entries are deleted, then the oldest-written ones, down to 90% of the
+    cap.  Age is measured from the last write (the file mtime, which also
+    drives the TTL), so disk eviction is oldest-first rather than strict LRU.
+    Empty responses are never cached, and disk writes are atomic.  Callers
+    that reject a non-empty response call :meth:`invalidate` so it is not
+    replayed.  With ``refresh`` set, cached entries are never read but fresh
+    responses still overwrite them.
+    """
+
+    def __init__(
+        self,
+        provider: AIProvider,
+        cache_dir: Path,
+        ttl_seconds: float,
+        max_memory_entries: int = _DEFAULT_MAX_MEMORY_ENTRIES,
+        max_disk_entries: int = _DEFAULT_MAX_DISK_ENTRIES,
+        refresh: bool = False,
+    ) -> None:
+        """Initialize the caching provider.
+
+        Args:
+            provider: The provider whose responses are cached.
+            cache_dir: Directory where cached responses are stored.
+            ttl_seconds: Maximum age of a disk entry before it is regenerated.
+            max_memory_entries: Number of responses kept in the in-memory LRU.
+            max_disk_entries: Number of responses kept on disk before the
+                oldest are pruned.
+            refresh: When True, skip cache reads and regenerate every
+                response, overwriting the stored entries.
+        """
+        self.provider = provider
+        self._cache_dir = cache_dir
+        self._ttl_seconds = ttl_seconds
+        self._max_memory_entries = max_memory_entries
+        self._max_disk_entries = max_disk_entries
+        self._refresh = refresh
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        # Approximate number of entries on disk; counted on the first write.
+        self._disk_entries: Optional[int] = None
+        self._disk_lock = threading.Lock()
+
+    @property
+    def model_id(self) -> str:
+        """Model identifier of the wrapped provider, used to namespace keys."""
+        return getattr(self.provider, "model_id", type(self.provider).__name__)
+
+    def refreshed(self) -> "CachingAIProvider":
+        """Return a provider over the same cache that skips cache reads."""
+        return CachingAIProvider(
+            self.provider,
+            cache_dir=self._cache_dir,
+            ttl_seconds=self._ttl_seconds,
+            max_memory_entries=self._max_memory_entries,
+            max_disk_entries=self._max_disk_entries,
+            refresh=True,
+        )
+
+    def generate(self, prompt: AIPrompt, max_tokens: int = 1000) -> str:
+        """Return a cached response, or generate and cache a new one.
+
+        Args:
+            prompt: The structured prompt to send to the model
+            max_tokens: Maximum tokens in the response (default: 1000)
+
+        Returns:
+            The model's response text
+
+        Raises:
+            Exception: If the wrapped provider's API call fails
+        """
+        key = self._cache_key(prompt, max_tokens)
+
+        cached = self._get_memory(key)
+        if cached is not None:
+            logger.debug("ai_cache_hit", source="memory", key=key)
+            return cached
+
+        cached = self._read_disk(key)
+        if cached is not None:
+            logger.debug("ai_cache_hit", source="disk", key=key)
+            self._put_memory(key, cached)
+            return cached
+
+        response = self.provider.generate(prompt, max_tokens=max_tokens)
+        if response.strip():
+            self._put_memory(key, response)
+            self._write_disk(key, response)
+        return response
+
+    def generate_many(
+        self,
+        prompts: Sequence[AIPrompt],
+        max_tokens: int = 1000,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
+    ) -> list[str]:
+        """Resolve cached prompts locally and send each distinct miss once.
+
+        Duplicate prompts within the batch share a single request, and the
+        remaining misses are forwarded to the wrapped provider's
+        ``generate_many`` so its concurrency is preserved.
+
+        Args:
+            prompts: The structured prompts to send to the model
+            max_tokens: Maximum tokens in each response (default: 1000)
+            max_workers: Upper bound on concurrent requests (default: 8)
+
+        Returns:
+            The model's response texts, in the same order as ``prompts``
+
+        Raises:
+            Exception: If any API call fails
+        """
+        keys = [self._cache_key(prompt, max_tokens) for prompt in prompts]
+        resolved: dict[str, str] = {}
+        misses: dict[str, AIPrompt] = {}
+        for key, prompt in zip(keys, prompts):
+            if key in resolved or key in misses:
+                continue
+            cached = self._get_memory(key)
+            if cached is None:
+                cached = self._read_disk(key)
+                if cached is not None:
+                    self._put_memory(key, cached)
+            if cached is not None:
+                resolved[key] = cached
+            else:
+                misses[key] = prompt
+
+        if misses:
+            logger.debug("ai_cache_batch", hits=len(resolved), misses=len(misses), total=len(prompts))
+            responses = self.provider.generate_many(
+                list(misses.values()), max_tokens=max_tokens, max_workers=max_workers,
+            )
+            for key, response in zip(misses, responses):
+                if response.strip():
+                    self._put_memory(key, response)
+                    self._write_disk(key, response)
+                resolved[key] = response
+
+        return [resolved[key] for key in keys]
+
+    def invalidate(self, prompt: AIPrompt, max_tokens: int = 1000) -> None:
+        """Drop the cached response for *prompt* from memory and disk."""
+        key = self._cache_key(prompt, max_tokens)
+        with self._lock:
+            self._memory.pop(key, None)
+        try:
+            self._cache_path(key).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("ai_cache_invalidate_failed", key=key, error=str(e))
+            return
+        logger.debug("ai_cache_invalidated", key=key)
+
+    def _cache_key(self, prompt: AIPrompt, max_tokens: int) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.model_id.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.build_full_prompt().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(str(max_tokens).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.txt"
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        if self._refresh:
+            return None
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            return value
+
+    def _put_memory(self, key: str, value: str) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if self._refresh:
+            return None
+        path = self._cache_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl_seconds:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, value: str) -> None:
+        # Never persist empty responses — callers treat them as failures.
+        # Non-empty responses a caller rejects are evicted via invalidate().
+        if not value.strip():
+            return
+        path = self._cache_path(key)
+        # Write to a unique temp file and rename it into place so concurrent
+        # writers or an interrupted run never leave a truncated entry.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not path.exists()
+            tmp_path.write_text(value, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("ai_cache_write_failed", cache_path=str(path), error=str(e))
+            return
+        with self._disk_lock:
+            if self._disk_entries is not None and is_new:
+                self._disk_entries += 1
+            if self._disk_entries is None or self._disk_entries > self._max_disk_entries:
+                self._disk_entries = self._prune_disk()
+
+    def _prune_disk(self) -> int:
+        """Delete expired entries, then the oldest beyond the cap; return the count left."""
+        now = time.time()
+        entries: list[tuple[float, str]] = []
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".txt") and entry.is_file():
+                        entries.append((entry.stat().st_mtime, entry.path))
+        except OSError as e:
+            logger.warning("ai_cache_prune_failed", cache_dir=str(self._cache_dir), error=str(e))
+            return 0
+        entries.sort()
+        live = [path for mtime, path in entries if now - mtime <= self._ttl_seconds]
+        doomed = [path for mtime, path in entries if now - mtime > self._ttl_seconds]
+        if len(live) > self._max_disk_entries:
+            # Leave headroom so the next prune is a tenth of the cap away.
+            excess = len(live) - self._max_disk_entries + self._max_disk_entries // 10
+            doomed.extend(live[:excess])
+            live = live[excess:]
+        for path in doomed:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        if doomed:
+            logger.debug("ai_cache_pruned", removed=len(doomed), remaining=len(live))
+        return len(live)
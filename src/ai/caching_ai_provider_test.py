@@ -0,0 +1,203 @@
+"""Tests for CachingAIProvider."""
+import os
+import time
+from pathlib import Path
+
+from src.ai.ai_provider import AIProvider
+from src.ai.caching_ai_provider import CachingAIProvider
+from src.domain.models import AIPrompt
+
+
+class _CountingAIProvider(AIProvider):
+    """Returns a fixed response and counts calls."""
+
+    model_id = "test-model"
+
+    def __init__(self, response: str = "response") -> None:
+        self.response = response
+        self.calls = 0
+
+    def generate(self, prompt: AIPrompt, max_tokens: int = 1000) -> str:
+        self.calls += 1
+        return self.response
+
+
+def _prompt(text: str = "TEXT") -> AIPrompt:
+    return AIPrompt(
+        static_instructions="STATIC",
+        book_context="BOOK",
+        character_registry="CHAR",
+        surrounding_context="CTX",
+        scene_registry="SCENE",
+        text_to_parse=text,
+    )
+
+
+class TestCachingAIProvider:
+    """Tests for prompt-keyed response caching."""
+
+    def test_repeated_prompt_hits_memory_cache(self, tmp_path: Path) -> None:
+        """The same prompt is only sent to the wrapped provider once."""
+        # Arrange
+        inner = _CountingAIProvider()
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+
+        # Act
+        first = provider.generate(_prompt(), max_tokens=100)
+        second = provider.generate(_prompt(), max_tokens=100)
+
+        # Assert
+        assert first == second == "response"
+        assert inner.calls == 1
+
+    def test_disk_cache_survives_new_instance(self, tmp_path: Path) -> None:
+        """A fresh provider instance reuses responses persisted to disk."""
+        # Arrange
+        inner = _CountingAIProvider()
+        CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600).generate(_prompt())
+
+        # Act
+        result = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600).generate(_prompt())
+
+        # Assert
+        assert result == "response"
+        assert inner.calls == 1
+
+    def test_different_max_tokens_is_a_cache_miss(self, tmp_path: Path) -> None:
+        """max_tokens is part of the cache key."""
+        # Arrange
+        inner = _CountingAIProvider()
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+
+        # Act
+        provider.generate(_prompt(), max_tokens=100)
+        provider.generate(_prompt(), max_tokens=200)
+
+        # Assert
+        assert inner.calls == 2
+
+    def test_expired_disk_entry_is_regenerated(self, tmp_path: Path) -> None:
+        """Disk entries older than the TTL are ignored."""
+        # Arrange
+        inner = _CountingAIProvider()
+        CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=60).generate(_prompt())
+        old = time.time() - 120
+        for path in tmp_path.iterdir():
+            os.utime(path, (old, old))
+
+        # Act
+        CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=60).generate(_prompt())
+
+        # Assert
+        assert inner.calls == 2
+
+    def test_generate_many_sends_duplicate_prompts_once(self, tmp_path: Path) -> None:
+        """Identical prompts in one batch share a single upstream request."""
+        # Arrange
+        inner = _CountingAIProvider()
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+        provider.generate(_prompt("cached"))
+
+        # Act
+        results = provider.generate_many([_prompt("a"), _prompt("cached"), _prompt("a")])
+
+        # Assert
+        assert results == ["response", "response", "response"]
+        assert inner.calls == 2
+
+    def test_empty_response_is_not_cached(self, tmp_path: Path) -> None:
+        """Empty responses are retried on the next call and never hit disk."""
+        # Arrange
+        inner = _CountingAIProvider(response="  ")
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+
+        # Act
+        provider.generate(_prompt())
+        provider.generate(_prompt())
+
+        # Assert
+        assert inner.calls == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalidate_drops_memory_and_disk_entry(self, tmp_path: Path) -> None:
+        """An invalidated response is regenerated on the next call."""
+        # Arrange
+        inner = _CountingAIProvider()
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+        provider.generate(_prompt(), max_tokens=100)
+
+        # Act
+        provider.invalidate(_prompt(), max_tokens=100)
+        provider.generate(_prompt(), max_tokens=100)
+
+        # Assert
+        assert inner.calls == 2
+
+    def test_invalidate_evicts_entry_written_by_generate_many(self, tmp_path: Path) -> None:
+        """A batch response the caller rejects is not replayed from disk."""
+        # Arrange
+        inner = _CountingAIProvider(response="{truncated")
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+        provider.generate_many([_prompt("a"), _prompt("b")])
+
+        # Act
+        provider.invalidate(_prompt("a"))
+        fresh = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+        fresh.generate_many([_prompt("a"), _prompt("b")])
+
+        # Assert
+        assert inner.calls == 3
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_refreshed_skips_reads_but_overwrites_entry(self, tmp_path: Path) -> None:
+        """A refreshed provider regenerates and replaces existing entries."""
+        # Arrange
+        inner = _CountingAIProvider(response="stale")
+        provider = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+        provider.generate(_prompt())
+        inner.response = "fresh"
+
+        # Act
+        refreshed = provider.refreshed().generate(_prompt())
+        reread = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600).generate(_prompt())
+
+        # Assert
+        assert refreshed == reread == "fresh"
+        assert inner.calls == 2
+
+    def test_write_past_disk_cap_prunes_oldest_entries(self, tmp_path: Path) -> None:
+        """Exceeding max_disk_entries deletes the oldest-written entries."""
+        # Arrange
+        inner = _CountingAIProvider()
+        seeded = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+        for i in range(10):
+            seeded.generate(_prompt(f"TEXT {i}"))
+        paths = sorted(tmp_path.iterdir())
+        now = time.time()
+        for age, path in enumerate(paths):
+            os.utime(path, (now - 100 + age, now - 100 + age))
+
+        # Act
+        CachingAIProvider(
+            inner, cache_dir=tmp_path, ttl_seconds=3600, max_disk_entries=10,
+        ).generate(_prompt("NEW"))
+
+        # Assert
+        remaining = set(tmp_path.iterdir())
+        assert len(remaining) == 9
+        assert not remaining & set(paths[:2])
+
+    def test_first_write_deletes_expired_disk_entries(self, tmp_path: Path) -> None:
+        """Expired entries are removed from disk, not just ignored."""
+        # Arrange
+        inner = _CountingAIProvider()
+        CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=60).generate(_prompt("OLD"))
+        old = time.time() - 120
+        for path in tmp_path.iterdir():
+            os.utime(path, (old, old))
+
+        # Act
+        CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=60).generate(_prompt("NEW"))
+
+        # Assert
+        assert len(list(tmp_path.iterdir())) == 1
@@ -1,4 +1,5 @@
 """ElevenLabs implementation of AmbientProvider."""
+import shutil
 from pathlib import Path
 from typing import Any, Optional
 
@@ -66,7 +67,7 @@ class ElevenLabsAmbientProvider(AmbientProvider):
             )
             # Copy from cache to output_path
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(cache_path.read_bytes())
+            shutil.copyfile(cache_path, output_path)
             return output_path
 
         # Create cache directory (namespaced)
@@ -19,11 +19,12 @@ synthesised into a temporary directory that is deleted after stitching.
 In **debug mode** (``debug=True``), beats are synthesised directly into
 the chapter folder and kept alongside ``chapter.mp3`` for inspection.
 
-Concatenation uses ffmpeg's ``concat`` demuxer (a list file approach) which
+Concatenation uses ffmpeg's ``concat`` demuxer (a list piped on stdin) which
 is the most reliable method for concatenating MP3 files without re-encoding.
 Silence clips are generated via ffmpeg's ``anullsrc`` lavfi source once per
 unique duration and reused across the chapter.
 """
+import os
 import re
 import subprocess
 from pathlib import Path
@@ -53,12 +54,31 @@ _SYNTHESISE_TYPES = {
 # Same character set as generate_book_id in src/repository/book_id.py.
 _UNSAFE_CHARS = re.compile(r'[:/\\<>"|?*]')
 
+# Static argv prefix shared by every ffmpeg invocation: overwrite output
+# without asking and only report errors on stderr.
+_FFMPEG_ARGV = ("ffmpeg", "-y", "-loglevel", "error")
+
 
 def _sanitize_dirname(name: str) -> str:
     """Replace filesystem-unsafe characters in *name* with ``-``."""
     return _UNSAFE_CHARS.sub("-", name)
 
 
+def _nonempty_file_names(directory: Path) -> set[str]:
+    """Return the names of non-empty regular files directly inside *directory*.
+
+    Returns an empty set when the directory does not exist yet.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name for entry in entries
+                if entry.is_file() and entry.stat().st_size > 0
+            }
+    except FileNotFoundError:
+        return set()
+
+
 def _get_audio_duration(path: Path) -> float:
     """Return the duration in seconds of the audio file at *path* via ffprobe.
 
@@ -82,6 +102,44 @@ def _get_audio_duration(path: Path) -> float:
     return 0.0
 
 
+def _is_zero_byte_file(path: Path) -> bool:
+    """Return True if *path* exists but has no content."""
+    try:
+        return path.stat().st_size == 0
+    except OSError:
+        return False
+
+
+def _concat_list_line(path: Path) -> str:
+    """Return the concat-demuxer ``file`` directive for *path*.
+
+    The path carries an explicit ``file:`` scheme: the list is read from
+    ``pipe:0``, and ffmpeg resolves bare entries relative to that URL.
+    Single quotes are escaped as ``'\\''`` (close quote, literal quote,
+    reopen) so paths containing apostrophes survive ffmpeg's parser.
+    """
+    quoted = Path(os.path.abspath(path)).as_posix().replace("'", "'\\''")
+    return f"file 'file:{quoted}'\n"
+
+
+def _run_ffmpeg(
+    cmd: list[str], stdin_data: Optional[bytes] = None
+) -> subprocess.CompletedProcess[bytes]:
+    """Run an ffmpeg command, discarding stdout and keeping raw stderr.
+
+    stderr is left undecoded so successful runs skip the UTF-8 decoding;
+    callers decode it only when reporting a failure.
+
+    Args:
+        cmd: Full ffmpeg argv.
+        stdin_data: Optional bytes fed to ffmpeg's stdin (e.g. a concat list
+            read via ``pipe:0``).
+    """
+    return subprocess.run(
+        cmd, input=stdin_data, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+
 def _compute_scene_time_ranges(
     beats: list[Beat],
     durations: list[float],
@@ -296,11 +354,9 @@ class AudioOrchestrator:
             self._stitch_with_ffmpeg(
                 beat_paths, output_mp3, synthesised_beats
             )
-            # Clean up non-beat artifacts (silence clips, concat list)
+            # Clean up non-beat artifacts (silence clips)
             for artifact in chapter_dir.glob("silence_*ms.mp3"):
                 artifact.unlink(missing_ok=True)
-            concat_list = chapter_dir / "concat_list.txt"
-            concat_list.unlink(missing_ok=True)
         else:
             # Normal mode — synthesise into permanent beats/{provider.name}/ dir
             beats_dir = chapter_dir / "beats" / self._provider.name
@@ -370,12 +426,15 @@ class AudioOrchestrator:
             scene_registry=scene_registry,
         )
 
+        # One directory scan up front instead of exists() + stat() per beat.
+        cached_names = _nonempty_file_names(tmp_dir)
+
         beat_paths: list[Path] = []
         for beat_index, beat in enumerate(speakable):
             beat_path = tmp_dir / f"beat_{beat_index:04d}.mp3"
 
             # Skip synthesis if beat already exists (cached from prior run)
-            if beat_path.exists() and beat_path.stat().st_size > 0:
+            if beat_path.name in cached_names:
                 logger.debug(
                     "tts_beat_cached",
                     beat_index=beat_index,
@@ -541,7 +600,7 @@ class AudioOrchestrator:
 
         # Build ffmpeg command: input 0 = speech, inputs 1..N = ambient files
         tmp_output = speech_path.with_suffix(".mixed.mp3")
-        cmd: list[str] = ["ffmpeg", "-y", "-i", str(speech_path)]
+        cmd: list[str] = [*_FFMPEG_ARGV, "-i", str(speech_path)]
         for ambient_path, _vol, _start, _end in ambient_entries:
             cmd.extend(["-i", str(ambient_path)])
         cmd.extend([
@@ -552,12 +611,12 @@ class AudioOrchestrator:
 
         logger.debug("tts_ambient_ffmpeg", cmd=" ".join(cmd))
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_ffmpeg(cmd)
         if result.returncode != 0:
             logger.warning(
                 "tts_ambient_mix_failed",
                 returncode=result.returncode,
-                stderr=result.stderr[:500],
+                stderr=result.stderr.decode("utf-8", errors="replace")[:500],
             )
             # Clean up temp file on failure — speech file remains unmixed
             tmp_output.unlink(missing_ok=True)
@@ -601,9 +660,9 @@ class AudioOrchestrator:
             prev_char = prev_beat.character_id or "narrator"
             curr_char = beats[i].character_id or "narrator"
 
-            if prev_beat.beat_type == BeatType.BOOK_TITLE:
+            if prev_beat.beat_type is BeatType.BOOK_TITLE:
                 duration_ms = self.SILENCE_AFTER_INTRODUCTION_MS
-            elif prev_beat.beat_type == BeatType.CHAPTER_ANNOUNCEMENT:
+            elif prev_beat.beat_type is BeatType.CHAPTER_ANNOUNCEMENT:
                 duration_ms = self.SILENCE_AFTER_ANNOUNCEMENT_MS
             elif prev_char == curr_char:
                 duration_ms = self._silence_same_speaker_ms
@@ -643,8 +702,7 @@ class AudioOrchestrator:
 
         duration_seconds = duration_ms / 1000.0
         cmd = [
-            "ffmpeg",
-            "-y",
+            *_FFMPEG_ARGV,
             "-f", "lavfi",
             "-i", "anullsrc=r=44100:cl=mono",
             "-t", str(duration_seconds),
@@ -659,12 +717,11 @@ class AudioOrchestrator:
             path=str(silence_path),
         )
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_ffmpeg(cmd)
         if result.returncode != 0:
             raise RuntimeError(
                 f"ffmpeg silence generation failed (exit {result.returncode}):\n"
-                f"stdout: {result.stdout}\n"
-                f"stderr: {result.stderr}"
+                f"stderr: {result.stderr.decode('utf-8', errors='replace')}"
             )
         return silence_path
 
@@ -676,7 +733,7 @@ class AudioOrchestrator:
     ) -> None:
         """Concatenate *beat_paths* into *output_path* using ffmpeg.
 
-        Uses the ``concat`` demuxer (list-file approach) which does not
+        Uses the ``concat`` demuxer (list piped on stdin) which does not
         re-encode the audio — beats are joined as-is.  When *beats*
         is provided, silence clips are interleaved between consecutive
         beat files based on speaker boundary type.
@@ -690,7 +747,7 @@ class AudioOrchestrator:
 
         Raises:
             RuntimeError: If ffmpeg exits with a non-zero return code or if
-                          there are no beats to stitch.
+                          a clip to stitch is an empty file.
         """
         if not beat_paths:
             logger.warning("tts_stitch_no_beats", output=str(output_path))
@@ -707,19 +764,32 @@ class AudioOrchestrator:
         else:
             concat_entries = list(beat_paths)
 
-        concat_list_path = concat_dir / "concat_list.txt"
-        with open(concat_list_path, "w", encoding="utf-8") as f:
-            for entry_path in concat_entries:
-                # ffmpeg concat list syntax: one line per file (absolute paths
-                # avoid resolution issues with concat demuxer).
-                f.write(f"file '{entry_path.resolve().as_posix()}'\n")
+        # A zero-byte clip means a synthesis failed; stitching around it would
+        # drop the line and shift the chapter timing, so refuse instead.
+        empty_entry = next(
+            (p for p in concat_entries if _is_zero_byte_file(p)), None
+        )
+        if empty_entry is not None:
+            raise RuntimeError(f"Cannot stitch empty audio clip: {empty_entry}")
+
+        # Earlier versions wrote the list to concat_list.txt next to the
+        # clips; remove any left over from those runs.
+        (concat_dir / "concat_list.txt").unlink(missing_ok=True)
+
+        # ffmpeg concat list syntax: one line per file (absolute paths avoid
+        # resolution issues with concat demuxer). abspath only touches the
+        # filesystem for relative paths, unlike resolve(). The list is piped
+        # to ffmpeg on stdin rather than written to a temporary file.
+        concat_list = "".join(
+            _concat_list_line(entry_path) for entry_path in concat_entries
+        ).encode("utf-8")
 
         cmd = [
-            "ffmpeg",
-            "-y",                     # overwrite output without asking
+            *_FFMPEG_ARGV,
             "-f", "concat",
             "-safe", "0",
-            "-i", str(concat_list_path),
+            "-protocol_whitelist", "pipe,file",
+            "-i", "pipe:0",
             "-c", "copy",
             str(output_path),
         ]
@@ -730,10 +800,9 @@ class AudioOrchestrator:
             output=str(output_path),
         )
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_ffmpeg(cmd, stdin_data=concat_list)
         if result.returncode != 0:
             raise RuntimeError(
                 f"ffmpeg failed (exit {result.returncode}):\n"
-                f"stdout: {result.stdout}\n"
-                f"stderr: {result.stderr}"
+                f"stderr: {result.stderr.decode('utf-8', errors='replace')}"
             )
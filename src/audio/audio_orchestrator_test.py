@@ -10,12 +10,15 @@ These tests verify:
   - Ambient audio is generated and mixed when ``ambient_enabled=True`` and scenes have
     ``ambient_prompt`` values.
 """
+import shutil
+import subprocess
 from pathlib import Path
 from typing import Any, Optional
 from unittest.mock import MagicMock
 
 import pytest
 
+from src.audio import audio_orchestrator
 from src.audio.audio_orchestrator import (
     AudioOrchestrator,
     _sanitize_dirname,
@@ -251,9 +254,8 @@ def _fake_ffmpeg_stitch(
     """Replace _stitch_with_ffmpeg to avoid a real ffmpeg dependency in tests."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_bytes(b"\x00" * 128)
-    # Simulate concat_list.txt and silence files that ffmpeg would leave behind
+    # Simulate silence files that ffmpeg would leave behind
     concat_dir = beat_paths[0].parent if beat_paths else output_path.parent
-    (concat_dir / "concat_list.txt").write_text("fake")
     (concat_dir / "silence_150ms.mp3").write_bytes(b"\x00" * 32)
 
 
@@ -1885,3 +1887,143 @@ class TestChapterAnnouncementInSynthesiseTypes:
 
         # Act / Assert
         assert BeatType.CHAPTER_ANNOUNCEMENT in _SYNTHESISE_TYPES
+
+
+# ------------------------------------------------------------------
+# _stitch_with_ffmpeg command construction
+# ------------------------------------------------------------------
+
+class TestStitchWithFfmpegPipesConcatList:
+    """The concat list reaches ffmpeg on stdin, one escaped line per clip."""
+
+    def test_concat_list_is_piped_with_escaped_clips(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """argv reads pipe:0 under a whitelist; stdin lists every clip escaped."""
+        # Arrange
+        calls: list[tuple[list[str], Optional[bytes]]] = []
+
+        def _fake_run_ffmpeg(
+            cmd: list[str], stdin_data: Optional[bytes] = None,
+        ) -> subprocess.CompletedProcess[bytes]:
+            calls.append((cmd, stdin_data))
+            return subprocess.CompletedProcess(cmd, 0, stderr=b"")
+
+        monkeypatch.setattr(audio_orchestrator, "_run_ffmpeg", _fake_run_ffmpeg)
+        first = tmp_path / "it's.mp3"
+        last = tmp_path / "last.mp3"
+        first.write_bytes(b"\x00" * 8)
+        last.write_bytes(b"\x00" * 8)
+        orch = AudioOrchestrator(MagicMock(), output_dir=tmp_path)
+
+        # Act
+        orch._stitch_with_ffmpeg([first, last], tmp_path / "chapter.mp3")
+
+        # Assert
+        cmd, stdin_data = calls[0]
+        assert cmd[cmd.index("-protocol_whitelist") + 1] == "pipe,file"
+        assert cmd[cmd.index("-i") + 1] == "pipe:0"
+        assert stdin_data is not None
+        assert stdin_data.decode("utf-8").splitlines() == [
+            f"file 'file:{tmp_path.as_posix()}/it'\\''s.mp3'",
+            f"file 'file:{tmp_path.as_posix()}/last.mp3'",
+        ]
+
+    def test_empty_clip_raises_naming_the_clip(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A zero-byte clip fails the stitch instead of being dropped."""
+        # Arrange
+        run_ffmpeg = MagicMock()
+        monkeypatch.setattr(audio_orchestrator, "_run_ffmpeg", run_ffmpeg)
+        first = tmp_path / "beat_0001.mp3"
+        empty = tmp_path / "beat_0002.mp3"
+        first.write_bytes(b"\x00" * 8)
+        empty.write_bytes(b"")
+        orch = AudioOrchestrator(MagicMock(), output_dir=tmp_path)
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="beat_0002.mp3"):
+            orch._stitch_with_ffmpeg([first, empty], tmp_path / "chapter.mp3")
+        run_ffmpeg.assert_not_called()
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not on PATH")
+    def test_real_ffmpeg_stitches_piped_concat_list(self, tmp_path: Path) -> None:
+        """Real ffmpeg opens every piped entry, including a quoted path."""
+        # Arrange
+        orch = AudioOrchestrator(MagicMock(), output_dir=tmp_path)
+        first = tmp_path / "it's.mp3"
+        last = tmp_path / "last.mp3"
+        for clip in (first, last):
+            subprocess.run(
+                [
+                    "ffmpeg", "-y", "-loglevel", "error",
+                    "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
+                    "-t", "0.2", "-q:a", "9", "-acodec", "libmp3lame",
+                    str(clip),
+                ],
+                check=True,
+            )
+        output = tmp_path / "chapter.mp3"
+
+        # Act
+        orch._stitch_with_ffmpeg([first, last], output)
+
+        # Assert
+        assert output.stat().st_size > max(first.stat().st_size, last.stat().st_size)
+        decoded = subprocess.run(
+            ["ffmpeg", "-loglevel", "error", "-i", str(output), "-f", "null", "-"],
+            capture_output=True,
+        )
+        assert decoded.returncode == 0, decoded.stderr
+
+    def test_stale_concat_list_file_is_removed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A concat_list.txt left by an earlier run is deleted when stitching."""
+        # Arrange
+        monkeypatch.setattr(
+            audio_orchestrator, "_run_ffmpeg",
+            lambda cmd, stdin_data=None: subprocess.CompletedProcess(cmd, 0, stderr=b""),
+        )
+        clip = tmp_path / "beat_0001.mp3"
+        clip.write_bytes(b"\x00" * 8)
+        stale = tmp_path / "concat_list.txt"
+        stale.write_text("file 'old.mp3'\n")
+        orch = AudioOrchestrator(MagicMock(), output_dir=tmp_path)
+
+        # Act
+        orch._stitch_with_ffmpeg([clip], tmp_path / "chapter.mp3")
+
+        # Assert
+        assert not stale.exists()
+
+
+class TestRunFfmpegFailureReporting:
+    """ffmpeg failures still raise, with the decoded stderr in the message."""
+
+    def test_nonzero_exit_raises_with_decoded_stderr(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A failing ffmpeg run surfaces its stderr text, not raw bytes."""
+        # Arrange
+        run_kwargs: dict[str, Any] = {}
+
+        def _fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[bytes]:
+            run_kwargs.update(kwargs, cmd=cmd)
+            return subprocess.CompletedProcess(
+                cmd, 1, stderr="pipe:0: Invalid data — ✗\n".encode("utf-8"),
+            )
+
+        monkeypatch.setattr(audio_orchestrator.subprocess, "run", _fake_run)
+        clip = tmp_path / "beat_0001.mp3"
+        clip.write_bytes(b"\x00" * 8)
+        orch = AudioOrchestrator(MagicMock(), output_dir=tmp_path)
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="exit 1") as exc_info:
+            orch._stitch_with_ffmpeg([clip], tmp_path / "chapter.mp3")
+        assert "pipe:0: Invalid data — ✗" in str(exc_info.value)
+        assert run_kwargs["cmd"][:4] == ["ffmpeg", "-y", "-loglevel", "error"]
+        assert run_kwargs["stdout"] is subprocess.DEVNULL
+        assert run_kwargs["stderr"] is subprocess.PIPE
@@ -1,5 +1,6 @@
 """Suno AI music provider implementation."""
 import hashlib
+import shutil
 import time
 from pathlib import Path
 from typing import Optional
@@ -77,7 +78,7 @@ class SunoMusicProvider(MusicProvider):
             )
             # Copy from cache to output_path
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(cache_path.read_bytes())
+            shutil.copyfile(cache_path, output_path)
             return output_path
 
         # Create cache directory (namespaced)
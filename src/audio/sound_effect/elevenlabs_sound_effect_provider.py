@@ -1,5 +1,6 @@
 """ElevenLabs implementation of SoundEffectProvider."""
 import hashlib
+import shutil
 from pathlib import Path
 from typing import Any, Optional
 
@@ -68,7 +69,7 @@ class ElevenLabsSoundEffectProvider(SoundEffectProvider):
             )
             # Copy from cache to output_path
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(cache_path.read_bytes())
+            shutil.copyfile(cache_path, output_path)
             return output_path
 
         # Create cache directory (namespaced)
@@ -27,17 +27,21 @@ Two presets cover the emotional spectrum:
   ``stability=0.65, style=0.05, similarity_boost=0.75, use_speaker_boost=True``
 """
 import os
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
 import structlog
 
-from src.audio.tts.tts_provider import TTSProvider
+from src.audio.tts.tts_provider import ConcurrentTTSProvider
 
 logger = structlog.get_logger(__name__)
 
 _MODEL_ID = "eleven_multilingual_v2"
 
+# Buffer size for streaming synthesized audio to disk (1 MiB).
+_WRITE_BUFFER_SIZE = 1 << 20
+
 # Per-model feature flags.  Flip _MODEL_ID and capabilities follow.
 _MODEL_CAPS: dict[str, dict[str, bool]] = {
     "eleven_v3": {
@@ -67,7 +71,7 @@ def _is_emotional(emotion: Optional[str]) -> bool:
 
 
 
-class ElevenLabsTTSProvider(TTSProvider):
+class ElevenLabsTTSProvider(ConcurrentTTSProvider):
     """ElevenLabs TTS provider.
 
     Wraps the ElevenLabs Python SDK v2.  All synthesis calls go through
@@ -79,25 +83,34 @@ class ElevenLabsTTSProvider(TTSProvider):
     def name(self) -> str:
         return "elevenlabs"
 
-    def __init__(self, api_key: str, books_dir: "Path | None" = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        books_dir: "Path | None" = None,
+        max_workers: int = 4,
+    ) -> None:
         """Initialise ElevenLabs provider.
 
         Args:
             api_key: ElevenLabs API key
             books_dir: Base directory for book output (used by provide()).
+            max_workers: Maximum concurrent synthesis requests in provide_many().
         """
+        super().__init__(books_dir or Path("books"), max_workers)
         self.api_key = api_key
-        self._books_dir = books_dir or Path("books")
         self._client: Any = None
-        self._beat_counter = 0
-
-    def provide(self, beat: Any, voice_id: str, book_id: str) -> float:
-        """Synthesize speech for a beat (not yet fully wired)."""
-        self._beat_counter += 1
-        output_path = (
-            self._books_dir / book_id / "audio" / "tts" / self.name
-            / f"beat_{self._beat_counter:04d}.mp3"
-        )
+        # provide_many() may create the client from several worker threads
+        self._client_lock = threading.Lock()
+        # Account voice list, fetched on first use (see refresh_voices()).
+        self._voices: Optional[list[Any]] = None
+
+    def _provide_at(self, beat: Any, voice_id: str, output_path: Path) -> float:
+        """Synthesize *beat* into *output_path* unless cached; return its duration.
+
+        Beats are synthesized without ``previous_request_ids`` chaining, so
+        concurrent :meth:`provide_many` requests are independent.  Wiring
+        chaining in would require serializing same-voice beats there.
+        """
         os.makedirs(output_path.parent, exist_ok=True)
 
         # Skip synthesis if beat already exists (cached from prior run)
@@ -111,23 +124,29 @@ class ElevenLabsTTSProvider(TTSProvider):
                 voice_style=getattr(beat, "voice_style", None),
                 voice_speed=getattr(beat, "voice_speed", None),
             )
-        from mutagen.mp3 import MP3  # type: ignore[import-not-found]
-        audio = MP3(str(output_path))
-        duration = float(audio.info.length)
+        duration = self._measure_duration(output_path)
         beat.audio_path = str(output_path)
         return duration
 
+    @staticmethod
+    def _measure_duration(path: Path) -> float:
+        """Measure the duration of an audio file in seconds."""
+        from mutagen.mp3 import MP3  # type: ignore[import-not-found]
+        audio = MP3(str(path))
+        return float(audio.info.length)
+
     def _get_client(self) -> Any:
         """Lazy initialisation of the ElevenLabs client."""
-        if self._client is None:
-            try:
-                from elevenlabs.client import ElevenLabs
-                self._client = ElevenLabs(api_key=self.api_key)
-            except ImportError:
-                raise ImportError(
-                    "elevenlabs package is required. "
-                    "Install with: pip install elevenlabs"
-                )
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    from elevenlabs.client import ElevenLabs
+                    self._client = ElevenLabs(api_key=self.api_key)
+                except ImportError:
+                    raise ImportError(
+                        "elevenlabs package is required. "
+                        "Install with: pip install elevenlabs"
+                    )
         return self._client
 
     def synthesize(
@@ -244,9 +263,10 @@ class ElevenLabsTTSProvider(TTSProvider):
             **context_kwargs,
         ) as raw_response:
             request_id = raw_response.headers.get("request-id")
-            with open(output_path, "wb") as f:
-                for chunk in raw_response.data:
-                    f.write(chunk)
+            # A large buffer coalesces the many small streamed chunks into
+            # a few writes, and writelines() drains the iterator in C.
+            with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(raw_response.data)
 
         logger.info(
             "elevenlabs_synthesize_done",
@@ -255,11 +275,20 @@ class ElevenLabsTTSProvider(TTSProvider):
         )
         return request_id
 
+    def _list_voices(self) -> list[Any]:
+        """Return the account's voices, fetching them from the API only once."""
+        if self._voices is None:
+            client = self._get_client()
+            self._voices = list(client.voices.get_all().voices)
+        return self._voices
+
+    def refresh_voices(self) -> None:
+        """Drop the cached voice list so the next lookup refetches it."""
+        self._voices = None
+
     def get_available_voices(self) -> dict[str, str]:
         """Return available ElevenLabs voices as ``{name: voice_id}``."""
-        client = self._get_client()
-        voices = client.voices.get_all()
-        return {voice.name: voice.voice_id for voice in voices.voices}
+        return {voice.name: voice.voice_id for voice in self._list_voices()}
 
     def get_voices(self) -> list[dict[str, Any]]:
         """Return available ElevenLabs voices with full metadata.
@@ -270,13 +299,11 @@ class ElevenLabsTTSProvider(TTSProvider):
             - name: str — human-readable voice name
             - labels: dict[str, str] — voice metadata tags (e.g. gender, age)
         """
-        client = self._get_client()
-        voices = client.voices.get_all()
         return [
             {
                 "voice_id": voice.voice_id,
                 "name": voice.name,
                 "labels": dict(voice.labels) if voice.labels else {},
             }
-            for voice in voices.voices
+            for voice in self._list_voices()
         ]
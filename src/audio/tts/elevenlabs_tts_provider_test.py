@@ -2,12 +2,13 @@
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 import src.audio.tts.elevenlabs_tts_provider as provider_mod
 from src.audio.tts.elevenlabs_tts_provider import ElevenLabsTTSProvider
+from src.domain.models import Beat, BeatType
 
 
 def _make_mock_client(
@@ -608,3 +609,57 @@ class TestElevenLabsTTSProviderGetVoices:
 
         # Assert
         mock_client.voices.get_all.assert_called_once()
+
+    def test_voice_list_is_fetched_once_until_refreshed(self) -> None:
+        """Voice lookups reuse one get_all() response until refresh_voices()."""
+        # Arrange
+        provider = ElevenLabsTTSProvider(api_key="test-key")
+        mock_client = MagicMock()
+
+        mock_voice = MagicMock()
+        mock_voice.voice_id = "voice_id_1"
+        mock_voice.name = "Voice One"
+        mock_voice.labels = None
+
+        mock_voices_response = MagicMock()
+        mock_voices_response.voices = [mock_voice]
+        mock_client.voices.get_all.return_value = mock_voices_response
+
+        provider._client = mock_client
+
+        # Act
+        provider.get_voices()
+        available = provider.get_available_voices()
+        provider.refresh_voices()
+        provider.get_voices()
+
+        # Assert
+        assert available == {"Voice One": "voice_id_1"}
+        assert mock_client.voices.get_all.call_count == 2
+
+
+# -- provide_many() ------------------------------------------------------------
+
+
+class TestElevenLabsTTSProviderProvideMany:
+    """Tests for concurrent provide_many()."""
+
+    def test_provide_many_assigns_paths_in_job_order(self, tmp_path: Path) -> None:
+        """provide_many numbers output files in job order even when run concurrently."""
+        # Arrange
+        provider = ElevenLabsTTSProvider(api_key="test-key", books_dir=tmp_path, max_workers=4)
+        mock_client = _make_mock_client()
+        provider._client = mock_client
+        beats = [Beat(text=f"Line {i}", beat_type=BeatType.NARRATION, character_id="narrator") for i in range(6)]
+
+        # Act
+        with patch.object(ElevenLabsTTSProvider, "_measure_duration", return_value=1.5):
+            durations = provider.provide_many([(b, "voice_1") for b in beats], "book-1")
+
+        # Assert
+        assert durations == [1.5] * 6
+        assert [b.audio_path for b in beats] == [
+            str(tmp_path / "book-1" / "audio" / "tts" / "elevenlabs" / f"beat_{i:04d}.mp3")
+            for i in range(1, 7)
+        ]
+        assert mock_client.text_to_speech.with_raw_response.convert.call_count == 6
@@ -1,18 +1,33 @@
 """Fish Audio TTS provider implementation."""
+import hashlib
 import os
+import shutil
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
 import requests
 import structlog
 
-from src.audio.tts.tts_provider import TTSProvider
+from src.audio.tts.tts_provider import ConcurrentTTSProvider
 from src.domain.models import Beat
 
 logger = structlog.get_logger(__name__)
 
+# Fixed pool of locks shared by cache entries, so memory stays bounded no
+# matter how many distinct beats a book has.
+_CACHE_LOCK_STRIPES = 64
 
-class FishAudioTTSProvider(TTSProvider):
+
+def _is_nonempty_file(path: Path) -> bool:
+    """Return True if *path* is an existing file with content."""
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
+class FishAudioTTSProvider(ConcurrentTTSProvider):
     """Fish Audio TTS provider implementation.
 
     Uses Fish Audio API for text-to-speech synthesis with emotion/style control.
@@ -27,6 +42,8 @@ class FishAudioTTSProvider(TTSProvider):
         api_key: str,
         books_dir: Path = Path("books"),
         base_url: str = "https://api.fish.audio/v1",
+        max_workers: int = 4,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """Initialize Fish Audio provider.
 
@@ -34,6 +51,10 @@ class FishAudioTTSProvider(TTSProvider):
             api_key: Fish Audio API key
             books_dir: Base directory for book output (used by provide()).
             base_url: Fish Audio API base URL (default production endpoint)
+            max_workers: Maximum concurrent synthesis requests in provide_many().
+            cache_dir: Optional directory for audio keyed by voice and beat
+                       content.  When set, re-runs reuse earlier synthesis
+                       even if beat numbering or text elsewhere changed.
 
         Raises:
             ValueError: If api_key is empty
@@ -41,49 +62,99 @@ class FishAudioTTSProvider(TTSProvider):
         if not api_key:
             raise ValueError("API key cannot be empty")
 
+        super().__init__(books_dir, max_workers)
         self.api_key = api_key
-        self._books_dir = books_dir
         self.base_url = base_url
         self._voice_cache: Optional[dict[str, str]] = None
-        self._beat_counter = 0
-
-    def provide(self, beat: Beat, voice_id: str, book_id: str) -> float:
-        """Synthesize speech for a beat.
-
-        Constructs output path, calls synthesize(), measures duration,
-        and sets beat.audio_path.
-
-        Args:
-            beat: The beat to synthesize.
-            voice_id: The voice identifier to use.
-            book_id: The book identifier.
+        self._cache_dir = cache_dir
+        # Striped per-cache-file locks so concurrent beats with identical
+        # content synthesise once instead of racing on the same entry
+        self._cache_locks = [threading.Lock() for _ in range(_CACHE_LOCK_STRIPES)]
+        # One pooled session per thread, so consecutive requests reuse the
+        # TLS connection; requests.Session is not documented as thread-safe.
+        self._local = threading.local()
 
-        Returns:
-            Duration of the generated audio in seconds.
-        """
-        self._beat_counter += 1
-        output_path = (
-            self._books_dir / book_id / "audio" / "tts" / self.name
-            / f"beat_{self._beat_counter:04d}.mp3"
-        )
+    @property
+    def _session(self) -> requests.Session:
+        """Return the calling thread's pooled HTTP session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def _provide_at(self, beat: Beat, voice_id: str, output_path: Path) -> float:
+        """Synthesize *beat* into *output_path* unless cached; return its duration."""
         os.makedirs(output_path.parent, exist_ok=True)
 
         # Skip synthesis if beat already exists (cached from prior run)
-        if not (output_path.exists() and output_path.stat().st_size > 0):
-            self.synthesize(
-                text=beat.text,
-                voice_id=voice_id,
-                output_path=output_path,
-                emotion=beat.emotion,
-                voice_stability=beat.voice_stability,
-                voice_style=beat.voice_style,
-                voice_speed=beat.voice_speed,
-            )
+        if _is_nonempty_file(output_path):
+            logger.debug("fish_audio_output_exists", output_path=str(output_path))
+        elif self._cache_dir is not None:
+            # Content-addressed cache: synthesise once per (voice, beat
+            # settings) and copy into the numbered output path.
+            cache_path = self._cache_path(self._cache_dir, beat, voice_id)
+            with self._cache_lock(cache_path):
+                if not _is_nonempty_file(cache_path):
+                    self._synthesize_to_cache(beat, voice_id, cache_path)
+                else:
+                    logger.debug("fish_audio_cache_hit", cache_path=str(cache_path))
+                if not _is_nonempty_file(cache_path):
+                    logger.error("fish_audio_cache_write_empty", cache_path=str(cache_path))
+                    raise RuntimeError(f"Fish Audio produced no audio for {output_path}")
+                shutil.copyfile(cache_path, output_path)
+        else:
+            self._synthesize_beat(beat, voice_id, output_path)
 
         duration = self._measure_duration(output_path)
         beat.audio_path = str(output_path)
         return duration
 
+    def _synthesize_beat(self, beat: Beat, voice_id: str, output_path: Path) -> None:
+        """Call :meth:`synthesize` with the beat's text and voice settings."""
+        self.synthesize(
+            text=beat.text,
+            voice_id=voice_id,
+            output_path=output_path,
+            emotion=beat.emotion,
+            voice_stability=beat.voice_stability,
+            voice_style=beat.voice_style,
+            voice_speed=beat.voice_speed,
+        )
+
+    def _synthesize_to_cache(self, beat: Beat, voice_id: str, cache_path: Path) -> None:
+        """Synthesize *beat* and atomically move the result to *cache_path*.
+
+        Audio is written to a temp file next to the entry and renamed into
+        place, so an interrupted write never leaves a truncated clip that
+        later runs would accept as a hit.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self._synthesize_beat(beat, voice_id, tmp_path)
+            if _is_nonempty_file(tmp_path):
+                os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _cache_lock(self, cache_path: Path) -> threading.Lock:
+        """Return the lock stripe serialising synthesis into *cache_path*."""
+        return self._cache_locks[hash(cache_path.name) % len(self._cache_locks)]
+
+    def _cache_path(self, cache_dir: Path, beat: Beat, voice_id: str) -> Path:
+        """Return the cache file under *cache_dir* for *beat* spoken by *voice_id*.
+
+        Only inputs Fish Audio actually uses (voice, text, emotion, speed)
+        are part of the key.
+        """
+        key = "\0".join((
+            voice_id, beat.text, beat.emotion or "", repr(beat.voice_speed),
+        ))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return cache_dir / self.name / f"{digest}.mp3"
+
     @staticmethod
     def _measure_duration(path: Path) -> float:
         """Measure the duration of an audio file in seconds."""
@@ -163,7 +234,7 @@ class FishAudioTTSProvider(TTSProvider):
 
         try:
             # Call Fish Audio API
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/tts",
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 json=request_body,
@@ -202,7 +273,7 @@ class FishAudioTTSProvider(TTSProvider):
             return self._voice_cache
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/voices",
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 timeout=30,
@@ -1,16 +1,25 @@
 """Tests for Fish Audio TTS provider."""
+import threading
+import time
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
 from src.audio.tts.fish_audio_tts_provider import FishAudioTTSProvider
+from src.domain.models import Beat, BeatType
 
 
 @pytest.fixture
 def mock_requests():
-    """Mock requests module."""
+    """Mock requests module.
+
+    ``requests.Session()`` returns the module mock itself, so tests can keep
+    configuring ``mock.post`` / ``mock.get`` directly.
+    """
     with patch("src.audio.tts.fish_audio_tts_provider.requests") as mock:
+        mock.Session.return_value = mock
         yield mock
 
 
@@ -96,6 +105,7 @@ def test_fish_audio_api_failure_returns_none(tmp_path):
     """Test API failure returns None and logs warning."""
     # Arrange
     with patch("src.audio.tts.fish_audio_tts_provider.requests") as mock_requests:
+        mock_requests.Session.return_value = mock_requests
         mock_requests.post.side_effect = requests.RequestException("API error")
         mock_requests.RequestException = requests.RequestException  # Patch the exception class too
 
@@ -198,3 +208,152 @@ def test_get_available_voices_returns_empty_on_transient_error(mock_requests):
 
     # Assert
     assert result == {}
+
+
+def test_provide_many_assigns_paths_in_job_order(mock_requests, tmp_path):
+    """provide_many numbers output files in job order even when run concurrently."""
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = b"audio"
+    mock_requests.post.return_value = mock_response
+
+    provider = FishAudioTTSProvider(api_key="test-key", books_dir=tmp_path, max_workers=4)
+    beats = [Beat(text=f"Line {i}", beat_type=BeatType.NARRATION, character_id="narrator") for i in range(6)]
+
+    # Act
+    with patch.object(FishAudioTTSProvider, "_measure_duration", return_value=1.5):
+        durations = provider.provide_many([(b, "voice_1") for b in beats], "book-1")
+
+    # Assert
+    assert durations == [1.5] * 6
+    assert [b.audio_path for b in beats] == [
+        str(tmp_path / "book-1" / "audio" / "tts" / "fish_audio" / f"beat_{i:04d}.mp3")
+        for i in range(1, 7)
+    ]
+
+
+def test_provide_reuses_cached_audio_for_same_beat_content(mock_requests, tmp_path):
+    """A beat with the same voice and text is synthesised once across runs."""
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = b"audio"
+    mock_requests.post.return_value = mock_response
+    cache_dir = tmp_path / "cache"
+    beat = Beat(text="Hello", beat_type=BeatType.NARRATION, character_id="narrator")
+
+    # Act
+    with patch.object(FishAudioTTSProvider, "_measure_duration", return_value=1.0):
+        FishAudioTTSProvider(api_key="test-key", books_dir=tmp_path, cache_dir=cache_dir).provide(
+            beat, "voice_1", "book-1",
+        )
+        FishAudioTTSProvider(api_key="test-key", books_dir=tmp_path / "other", cache_dir=cache_dir).provide(
+            beat, "voice_1", "book-1",
+        )
+
+    # Assert
+    assert mock_requests.post.call_count == 1
+    assert (tmp_path / "other" / "book-1" / "audio" / "tts" / "fish_audio" / "beat_0001.mp3").read_bytes() == b"audio"
+
+
+def test_provide_many_synthesises_duplicate_cached_beats_once(mock_requests, tmp_path):
+    """Concurrent beats with the same cache key share one request and entry."""
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = b"audio"
+
+    def _slow_post(*_args: object, **_kwargs: object) -> Mock:
+        time.sleep(0.05)  # keep the first request in flight while the others start
+        return mock_response
+
+    mock_requests.post.side_effect = _slow_post
+    cache_dir = tmp_path / "cache"
+    provider = FishAudioTTSProvider(
+        api_key="test-key", books_dir=tmp_path, max_workers=4, cache_dir=cache_dir,
+    )
+    beats = [Beat(text="Hello", beat_type=BeatType.NARRATION, character_id="narrator") for _ in range(4)]
+
+    # Act
+    with patch.object(FishAudioTTSProvider, "_measure_duration", return_value=1.0):
+        provider.provide_many([(b, "voice_1") for b in beats], "book-1")
+
+    # Assert
+    assert mock_requests.post.call_count == 1
+    assert [p.suffix for p in (cache_dir / "fish_audio").iterdir()] == [".mp3"]
+
+
+def test_each_thread_gets_its_own_session(mock_requests):
+    """Worker threads never share a requests.Session; each thread reuses its own."""
+    # Arrange
+    provider = FishAudioTTSProvider(api_key="test-key")
+    mock_requests.Session.side_effect = lambda: Mock()
+    sessions: list[object] = []
+
+    def _grab() -> None:
+        sessions.extend([provider._session, provider._session])
+
+    # Act
+    worker = threading.Thread(target=_grab)
+    worker.start()
+    worker.join()
+    _grab()
+
+    # Assert
+    assert sessions[0] is sessions[1]
+    assert sessions[2] is sessions[3]
+    assert sessions[0] is not sessions[2]
+
+
+def test_interrupted_write_leaves_no_cache_entry(mock_requests, tmp_path):
+    """A write that dies part-way leaves no truncated clip in the cache."""
+    # Arrange
+    mock_response = Mock()
+    mock_response.content = b"audio"
+    mock_requests.post.return_value = mock_response
+    mock_requests.RequestException = requests.RequestException
+    cache_dir = tmp_path / "cache"
+    provider = FishAudioTTSProvider(api_key="test-key", books_dir=tmp_path, cache_dir=cache_dir)
+    beat = Beat(text="Hello", beat_type=BeatType.NARRATION, character_id="narrator")
+
+    def _partial_write(self: Path, data: bytes) -> int:
+        with open(self, "wb") as f:
+            f.write(data[:2])
+        raise OSError("disk full")
+
+    # Act
+    with patch.object(Path, "write_bytes", _partial_write), pytest.raises(OSError):
+        provider.provide(beat, "voice_1", "book-1")
+
+    # Assert
+    assert list((cache_dir / "fish_audio").iterdir()) == []
+
+
+def test_provide_reuses_existing_output_when_cache_enabled(mock_requests, tmp_path):
+    """A beat already rendered at its output path is not re-synthesised."""
+    # Arrange
+    output_path = tmp_path / "book-1" / "audio" / "tts" / "fish_audio" / "beat_0001.mp3"
+    output_path.parent.mkdir(parents=True)
+    output_path.write_bytes(b"earlier audio")
+    provider = FishAudioTTSProvider(api_key="test-key", books_dir=tmp_path, cache_dir=tmp_path / "cache")
+    beat = Beat(text="Hello", beat_type=BeatType.NARRATION, character_id="narrator")
+
+    # Act
+    with patch.object(FishAudioTTSProvider, "_measure_duration", return_value=2.0):
+        duration = provider.provide(beat, "voice_1", "book-1")
+
+    # Assert
+    assert duration == 2.0
+    mock_requests.post.assert_not_called()
+    assert output_path.read_bytes() == b"earlier audio"
+
+
+def test_provide_raises_when_cached_synthesis_produces_no_audio(mock_requests, tmp_path):
+    """A failed request surfaces as an error instead of measuring a missing file."""
+    # Arrange
+    mock_requests.post.side_effect = requests.RequestException("API error")
+    mock_requests.RequestException = requests.RequestException
+    provider = FishAudioTTSProvider(api_key="test-key", books_dir=tmp_path, cache_dir=tmp_path / "cache")
+    beat = Beat(text="Hello", beat_type=BeatType.NARRATION, character_id="narrator")
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="produced no audio"):
+        provider.provide(beat, "voice_1", "book-1")
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from src.domain.models import Beat
 
@@ -36,6 +37,26 @@ class TTSProvider(ABC):
             Duration of the generated audio in seconds.
         """
 
+    def provide_many(
+        self,
+        jobs: Sequence[tuple[Beat, str]],
+        book_id: str,
+    ) -> list[float]:
+        """Synthesize speech for several beats.
+
+        The default implementation calls :meth:`provide` for each job in
+        order.  Providers whose synthesis calls are independent can derive
+        from :class:`ConcurrentTTSProvider` to run them concurrently.
+
+        Args:
+            jobs: ``(beat, voice_id)`` pairs, in playback order.
+            book_id: The book identifier (used for output path construction).
+
+        Returns:
+            Duration in seconds of each generated clip, in job order.
+        """
+        return [self.provide(beat, voice_id, book_id) for beat, voice_id in jobs]
+
     @abstractmethod
     def synthesize(
         self,
@@ -106,6 +127,81 @@ class TTSProvider(ABC):
         pass
 
 
+class ConcurrentTTSProvider(TTSProvider):
+    """Base class for providers that synthesize beats concurrently.
+
+    Output files are numbered sequentially per provider instance.
+    :meth:`provide_many` reserves those paths in job order before any
+    request is sent, so numbering matches sequential :meth:`provide` calls,
+    then runs :meth:`_provide_at` on a thread pool.  Subclasses must keep
+    :meth:`_provide_at` safe to call from several threads at once.
+    """
+
+    def __init__(self, books_dir: Path, max_workers: int) -> None:
+        """Initialise path numbering and the worker bound.
+
+        Args:
+            books_dir: Base directory for book output.
+            max_workers: Maximum concurrent synthesis requests in provide_many().
+        """
+        self._books_dir = books_dir
+        self._beat_counter = 0
+        self._max_workers = max_workers
+
+    def provide(self, beat: Beat, voice_id: str, book_id: str) -> float:
+        """Synthesize *beat* into the next numbered output path.
+
+        Args:
+            beat: The beat to synthesize.
+            voice_id: The voice identifier to use.
+            book_id: The book identifier.
+
+        Returns:
+            Duration of the generated audio in seconds.
+        """
+        return self._provide_at(beat, voice_id, self._next_output_path(book_id))
+
+    def provide_many(
+        self,
+        jobs: Sequence[tuple[Beat, str]],
+        book_id: str,
+    ) -> list[float]:
+        """Synthesize several beats with up to ``max_workers`` concurrent requests.
+
+        Args:
+            jobs: ``(beat, voice_id)`` pairs, in playback order.
+            book_id: The book identifier.
+
+        Returns:
+            Duration in seconds of each generated clip, in job order.
+        """
+        paths = [self._next_output_path(book_id) for _ in jobs]
+        if len(jobs) <= 1 or self._max_workers <= 1:
+            return [
+                self._provide_at(beat, voice_id, path)
+                for (beat, voice_id), path in zip(jobs, paths)
+            ]
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(jobs))) as executor:
+            return list(executor.map(
+                self._provide_at,
+                [beat for beat, _ in jobs],
+                [voice_id for _, voice_id in jobs],
+                paths,
+            ))
+
+    @abstractmethod
+    def _provide_at(self, beat: Beat, voice_id: str, output_path: Path) -> float:
+        """Synthesize *beat* into *output_path* and return its duration."""
+
+    def _next_output_path(self, book_id: str) -> Path:
+        """Reserve the next sequential beat output path for *book_id*."""
+        self._beat_counter += 1
+        return (
+            self._books_dir / book_id / "audio" / "tts" / self.name
+            / f"beat_{self._beat_counter:04d}.mp3"
+        )
+
+
 class StubTTSProvider(TTSProvider):
     """Test helper that wraps a pre-built list of ``VoiceEntry`` objects as a ``TTSProvider``.
 
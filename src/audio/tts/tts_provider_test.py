@@ -4,8 +4,13 @@ from typing import Any, Optional
 
 import pytest
 
-from src.audio.tts.tts_provider import StubTTSProvider, TTSProvider
+from src.audio.tts.tts_provider import (
+    ConcurrentTTSProvider,
+    StubTTSProvider,
+    TTSProvider,
+)
 from src.audio.tts.voice_assigner import VoiceEntry
+from src.domain.models import Beat, BeatType
 
 
 class MinimalTTSProvider(TTSProvider):
@@ -15,7 +20,7 @@ class MinimalTTSProvider(TTSProvider):
     def name(self) -> str:
         return "minimal"
 
-    def provide(self, beat: object, voice_id: str, book_id: str) -> float:
+    def provide(self, beat: Beat, voice_id: str, book_id: str) -> float:
         return 0.0
 
     def synthesize(
@@ -52,7 +57,7 @@ class TestTTSProviderNameProperty:
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
 
             class NoNameProvider(TTSProvider):
-                def provide(self, beat: object, voice_id: str, book_id: str) -> float:
+                def provide(self, beat: Beat, voice_id: str, book_id: str) -> float:
                     return 0.0
 
                 def synthesize(
@@ -171,3 +176,58 @@ class TestStubTTSProvider:
         # Act & Assert
         with pytest.raises(NotImplementedError):
             stub.get_available_voices()
+
+
+class PooledTTSProvider(ConcurrentTTSProvider, MinimalTTSProvider):
+    """Concurrent provider whose _provide_at records the reserved path."""
+
+    def __init__(self, books_dir: Path) -> None:
+        super().__init__(books_dir, max_workers=4)
+
+    def _provide_at(self, beat: Beat, voice_id: str, output_path: Path) -> float:
+        beat.audio_path = str(output_path)
+        return float(len(voice_id))
+
+
+class TestTTSProviderProvideMany:
+    """Tests for the shared provide_many() fan-out."""
+
+    def test_concurrent_provide_many_numbers_paths_in_job_order(self, tmp_path: Path) -> None:
+        """Output paths and durations follow job order when run on a pool."""
+        # Arrange
+        provider = PooledTTSProvider(tmp_path)
+        beats = [Beat(text=f"Line {i}", beat_type=BeatType.NARRATION) for i in range(3)]
+        jobs = [(beat, "v" * (i + 1)) for i, beat in enumerate(beats)]
+
+        # Act
+        durations = provider.provide_many(jobs, "book-1")
+
+        # Assert
+        assert durations == [1.0, 2.0, 3.0]
+        assert [beat.audio_path for beat in beats] == [
+            str(tmp_path / "book-1" / "audio" / "tts" / "minimal" / f"beat_{i:04d}.mp3")
+            for i in (1, 2, 3)
+        ]
+
+    def test_default_provide_many_calls_provide_in_order(self) -> None:
+        """Without _max_workers, provide_many() delegates to provide()."""
+        # Arrange
+        stub = StubTTSProvider([], fixed_duration=2.0)
+        beats = [Beat(text=f"Line {i}", beat_type=BeatType.NARRATION) for i in range(2)]
+
+        # Act
+        durations = stub.provide_many([(beat, "v1") for beat in beats], "book-1")
+
+        # Assert
+        assert durations == [2.0, 2.0]
+        assert beats[1].audio_path == "books/book-1/audio/tts/stub/beat_0002.mp3"
+
+    def test_concurrent_provider_requires_provide_at(self, tmp_path: Path) -> None:
+        """A ConcurrentTTSProvider without _provide_at cannot be instantiated."""
+        # Arrange
+        class _NoProvideAt(ConcurrentTTSProvider, MinimalTTSProvider):
+            pass
+
+        # Act & Assert
+        with pytest.raises(TypeError, match="_provide_at"):
+            _NoProvideAt(tmp_path, max_workers=4)  # type: ignore[abstract]
@@ -11,6 +11,7 @@ as project dependencies because they are heavy; install them manually::
 
     pip install torch transformers
 """
+import copy
 from pathlib import Path
 from typing import Any, Optional
 
@@ -71,6 +72,9 @@ class VibeVoiceTTSProvider(TTSProvider):
         # Lazy-loaded on first use
         self._model: Any = None
         self._processor: Any = None
+        # Voice embeddings by voice_id (None when no embedding was found),
+        # loaded from disk at most once per provider instance.
+        self._voice_embeddings: dict[str, Any] = {}
 
     def provide(self, beat: Any, voice_id: str, book_id: str) -> float:
         """Not yet implemented for VibeVoice provider."""
@@ -138,6 +142,28 @@ class VibeVoiceTTSProvider(TTSProvider):
             logger.debug("vibevoice_voice_file_not_found", voice_id=voice_id)
             return None
 
+    def _load_voice_embedding(self, voice_id: str) -> Any:
+        """Return a fresh copy of the prefilled outputs for *voice_id*.
+
+        The embedding is resolved and loaded from disk on first use and kept
+        in memory.  Each call returns a deep copy because generation consumes
+        the prefilled state.
+        """
+        if voice_id not in self._voice_embeddings:
+            import torch  # type: ignore[import-not-found]
+
+            voice_path = self._resolve_voice_path(voice_id)
+            embedding = None
+            if voice_path is not None:
+                embedding = torch.load(voice_path, map_location=self._device, weights_only=True)
+                logger.debug("vibevoice_voice_loaded", voice_id=voice_id)
+            else:
+                logger.warning("vibevoice_voice_not_found_using_default", voice_id=voice_id)
+            self._voice_embeddings[voice_id] = embedding
+
+        embedding = self._voice_embeddings[voice_id]
+        return copy.deepcopy(embedding) if embedding is not None else None
+
     # ── TTSProvider interface ───────────────────────────────────────────
 
     def synthesize(
@@ -170,8 +196,6 @@ class VibeVoiceTTSProvider(TTSProvider):
         Returns:
             ``None`` — local inference has no request ID concept.
         """
-        import torch  # type: ignore[import-not-found]
-
         self._ensure_loaded()
 
         logger.info(
@@ -182,13 +206,7 @@ class VibeVoiceTTSProvider(TTSProvider):
         )
 
         # Load voice embedding (if available)
-        voice_path = self._resolve_voice_path(voice_id)
-        all_prefilled_outputs = None
-        if voice_path is not None:
-            all_prefilled_outputs = torch.load(voice_path, map_location=self._device, weights_only=True)
-            logger.debug("vibevoice_voice_loaded", voice_id=voice_id)
-        else:
-            logger.warning("vibevoice_voice_not_found_using_default", voice_id=voice_id)
+        all_prefilled_outputs = self._load_voice_embedding(voice_id)
 
         try:
             inputs = self._processor(text=text, return_tensors="pt").to(self._device)
@@ -1,6 +1,7 @@
 """Configuration management for the audiobook generator."""
 import argparse
 import os
+import threading
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -9,6 +10,26 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
+def _positive_int_env(name: str, default: int) -> int:
+    """Read the integer environment variable *name*, which must be at least 1.
+
+    An unset or blank variable yields *default*.
+
+    Raises:
+        ValueError: If the value is not an integer or is below 1.
+    """
+    raw = os.getenv(name, '').strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer >= 1, got {raw!r}") from None
+    if value < 1:
+        raise ValueError(f"{name} must be an integer >= 1, got {value}")
+    return value
+
+
 @dataclass
 class AWSConfig:
     """AWS-specific configuration."""
@@ -60,6 +81,12 @@ class Config:
     # AI Provider selection
     ai_provider: str  # "bedrock" or "anthropic"
 
+    # Days a cached AI response stays valid before it is regenerated
+    ai_cache_ttl_days: int = 30
+
+    # Maximum concurrent TTS synthesis requests per provider
+    tts_concurrency: int = 4
+
     # Audio Provider API Keys
     elevenlabs_api_key: Optional[str] = None
     fish_audio_api_key: Optional[str] = None
@@ -71,11 +98,16 @@ class Config:
 
         Returns:
             Config instance with values from environment variables
+
+        Raises:
+            ValueError: If a numeric variable is malformed or out of range
         """
         return cls(
             aws=AWSConfig.from_env(),
             anthropic=AnthropicConfig.from_env(),
             ai_provider=os.getenv('AI_PROVIDER', 'bedrock'),
+            ai_cache_ttl_days=_positive_int_env('AI_CACHE_TTL_DAYS', 30),
+            tts_concurrency=_positive_int_env('TTS_CONCURRENCY', 4),
             elevenlabs_api_key=os.getenv('ELEVENLABS_API_KEY'),
             fish_audio_api_key=os.getenv('FISH_AUDIO_API_KEY'),
             suno_api_key=os.getenv('SUNO_API_KEY'),
@@ -90,16 +122,20 @@ class Config:
 
 # Global config instance - lazy loaded
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     """Get the global configuration instance.
 
     This is lazy-loaded on first access and reused for subsequent calls.
+    Safe to call from multiple threads; the environment is read only once.
     """
     global _config
     if _config is None:
-        _config = Config.from_env()
+        with _config_lock:
+            if _config is None:
+                _config = Config.from_env()
     return _config
 
 
@@ -109,8 +145,62 @@ def reload_config() -> Config:
     Useful for testing or when environment changes at runtime.
     """
     global _config
-    _config = Config.from_env()
-    return _config
+    with _config_lock:
+        _config = Config.from_env()
+        return _config
+
+
+def _build_cli_parser() -> argparse.ArgumentParser:
+    """Build the workflow CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Run a book-processing workflow.",
+    )
+    parser.add_argument(
+        "--workflow",
+        choices=["parse", "ai", "tts", "ambient", "sfx", "music", "mix"],
+        default="ai",
+        help="Workflow to run (default: ai)",
+    )
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="Project Gutenberg zip URL (required for parse/ai/tts/ambient/sfx/music/mix)"
+    )
+    parser.add_argument(
+        "--start-chapter",
+        type=int,
+        default=1,
+        help="1-based start chapter (default: 1)"
+    )
+    parser.add_argument(
+        "--end-chapter",
+        type=int,
+        default=None,
+        help="1-based end chapter (inclusive)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        default=False,
+        help="Bypass cache and re-run the workflow stage from scratch"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        default=False,
+        help="Keep individual beat MP3 files"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Disable the on-disk AI response cache"
+    )
+    return parser
+
+
+# Built once at import; parse_args() does not mutate the parser.
+_CLI_PARSER = _build_cli_parser()
 
 
 @dataclass
@@ -129,6 +219,7 @@ class CLIConfig:
     end_chapter: Optional[int] = None
     refresh: bool = False
     debug: bool = False
+    no_cache: bool = False
 
     @classmethod
     def from_cli(cls) -> 'CLIConfig':
@@ -137,46 +228,7 @@ class CLIConfig:
         Returns:
             CLIConfig instance with values from command-line arguments
         """
-        parser = argparse.ArgumentParser(
-            description="Run a book-processing workflow.",
-        )
-        parser.add_argument(
-            "--workflow",
-            choices=["parse", "ai", "tts", "ambient", "sfx", "music", "mix"],
-            default="ai",
-            help="Workflow to run (default: ai)",
-        )
-        parser.add_argument(
-            "--url",
-            default=None,
-            help="Project Gutenberg zip URL (required for parse/ai/tts/ambient/sfx/music/mix)"
-        )
-        parser.add_argument(
-            "--start-chapter",
-            type=int,
-            default=1,
-            help="1-based start chapter (default: 1)"
-        )
-        parser.add_argument(
-            "--end-chapter",
-            type=int,
-            default=None,
-            help="1-based end chapter (inclusive)"
-        )
-        parser.add_argument(
-            "--refresh",
-            action="store_true",
-            default=False,
-            help="Bypass cache and re-run the workflow stage from scratch"
-        )
-        parser.add_argument(
-            "--debug",
-            action="store_true",
-            default=False,
-            help="Keep individual beat MP3 files"
-        )
-
-        args = parser.parse_args()
+        args = _CLI_PARSER.parse_args()
 
         return cls(
             workflow=args.workflow,
@@ -185,6 +237,7 @@ class CLIConfig:
             end_chapter=args.end_chapter,
             refresh=args.refresh,
             debug=args.debug,
+            no_cache=args.no_cache,
         )
 
     def run_kwargs(self) -> dict[str, Any]:
@@ -205,3 +258,16 @@ class CLIConfig:
             kwargs['debug'] = self.debug
 
         return kwargs
+
+    def factory_kwargs(self) -> dict[str, Any]:
+        """Build kwargs dict for create_workflow() from CLI config.
+
+        Returns:
+            Dict with keys suitable for splatting into create_workflow()
+        """
+        kwargs: dict[str, Any] = {}
+
+        if self.no_cache:
+            kwargs['ai_cache'] = False
+
+        return kwargs
@@ -1,5 +1,11 @@
 """Tests for configuration module."""
-from .config import AWSConfig, CLIConfig, Config
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from . import config as config_module
+from .config import AWSConfig, CLIConfig, Config, get_config
 
 
 class TestAWSConfig:
@@ -70,6 +76,51 @@ class TestConfig:
         # Assert
         assert config.fish_audio_api_key is None
 
+    def test_ai_cache_ttl_days_from_env(self, monkeypatch):
+        """Test that ai_cache_ttl_days is loaded from AI_CACHE_TTL_DAYS, blank meaning default."""
+        # Arrange
+        monkeypatch.setenv('AI_CACHE_TTL_DAYS', '7')
+
+        # Act
+        config = Config.from_env()
+        monkeypatch.setenv('AI_CACHE_TTL_DAYS', ' ')
+        blank = Config.from_env()
+
+        # Assert
+        assert config.ai_cache_ttl_days == 7
+        assert blank.ai_cache_ttl_days == 30
+
+    @pytest.mark.parametrize('value', ['thirty', '0', '-1'])
+    def test_invalid_ai_cache_ttl_days_names_the_variable(self, monkeypatch, value):
+        """Test that a malformed or non-positive AI_CACHE_TTL_DAYS is rejected by name."""
+        # Arrange
+        monkeypatch.setenv('AI_CACHE_TTL_DAYS', value)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match='AI_CACHE_TTL_DAYS must be an integer >= 1'):
+            Config.from_env()
+
+    def test_tts_concurrency_from_env(self, monkeypatch):
+        """Test that tts_concurrency is loaded from TTS_CONCURRENCY env var."""
+        # Arrange
+        monkeypatch.setenv('TTS_CONCURRENCY', '8')
+
+        # Act
+        config = Config.from_env()
+
+        # Assert
+        assert config.tts_concurrency == 8
+
+    @pytest.mark.parametrize('value', ['four', '0', '-2'])
+    def test_invalid_tts_concurrency_names_the_variable(self, monkeypatch, value):
+        """Test that a malformed or non-positive TTS_CONCURRENCY is rejected by name."""
+        # Arrange
+        monkeypatch.setenv('TTS_CONCURRENCY', value)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match='TTS_CONCURRENCY must be an integer >= 1'):
+            Config.from_env()
+
     def test_suno_api_key_from_env(self, monkeypatch):
         """Test that suno_api_key is loaded from SUNO_API_KEY env var."""
         # Arrange
@@ -104,6 +155,24 @@ class TestConfig:
         assert config.elevenlabs_api_key == 'test-el-key'
 
 
+class TestGetConfig:
+    """Tests for the global get_config accessor."""
+
+    def test_concurrent_first_access_loads_env_once(self, monkeypatch):
+        """Threads racing on first access share one Config built once."""
+        # Arrange
+        monkeypatch.setattr(config_module, '_config', None)
+
+        # Act
+        with patch.object(Config, 'from_env', wraps=Config.from_env) as from_env:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                configs = list(pool.map(lambda _: get_config(), range(32)))
+
+        # Assert
+        assert from_env.call_count == 1
+        assert all(c is configs[0] for c in configs)
+
+
 class TestCLIConfig:
     """Tests for CLIConfig."""
 
@@ -189,6 +258,21 @@ class TestCLIConfig:
         assert kwargs['refresh'] is True
         assert kwargs['debug'] is True
 
+    def test_factory_kwargs_disables_ai_cache_with_no_cache_flag(self, monkeypatch):
+        """Test that --no-cache is forwarded to create_workflow()."""
+        # Arrange
+        monkeypatch.setattr('sys.argv', [
+            'prog', '--workflow', 'ai', '--url', 'http://example.com', '--no-cache'
+        ])
+        config = CLIConfig.from_cli()
+
+        # Act
+        kwargs = config.factory_kwargs()
+
+        # Assert
+        assert config.no_cache is True
+        assert kwargs == {'ai_cache': False}
+
     def test_from_cli_defaults_workflow_to_ai(self, monkeypatch):
         """Test that workflow defaults to 'ai' when not specified."""
         # Arrange
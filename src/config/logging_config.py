@@ -12,13 +12,24 @@ Log level is controlled by (in priority order):
 1. The ``log_level`` argument to :func:`configure`
 2. The ``LOG_LEVEL`` environment variable
 3. The default of ``"INFO"``
+
+Console output is written by a background :class:`logging.handlers.QueueListener`
+thread, so emitting a log event never blocks the caller on terminal or pipe I/O.
 """
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 import structlog
 
+# Console output sits behind this queue handler and listener thread; see
+# _route_stream_handlers_through_queue().
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
 
 def configure(log_level: Optional[str] = None) -> None:
     """Configure structlog and the stdlib ``logging`` root logger.
@@ -48,6 +59,7 @@ def configure(log_level: Optional[str] = None) -> None:
         level=effective_level,
     )
     logging.getLogger().setLevel(effective_level)
+    _route_stream_handlers_through_queue(logging.getLogger())
 
     # Shared processors applied to every structlog log entry
     shared_processors: list[structlog.types.Processor] = [
@@ -67,3 +79,49 @@ def configure(log_level: Optional[str] = None) -> None:
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
+
+
+def _route_stream_handlers_through_queue(root: logging.Logger) -> None:
+    """Move the root logger's console handlers behind a queue.
+
+    Only plain ``StreamHandler`` instances (such as the one installed by
+    ``basicConfig``) are moved; other handlers, e.g. pytest's capture
+    handlers, are left untouched. A repeated call moves the previous
+    listener's handlers, plus any console handlers added since, behind a
+    fresh queue and stops the previous listener, so only one listener and
+    one ``QueueHandler`` are ever installed.
+    """
+    global _queue_listener, _queue_handler
+    old_listener, old_handler = _queue_listener, _queue_handler
+    stream_handlers: list[logging.Handler] = [
+        h for h in root.handlers if type(h) is logging.StreamHandler
+    ]
+    if old_listener is not None:
+        stream_handlers = [*old_listener.handlers, *stream_handlers]
+    if not stream_handlers:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for handler in stream_handlers:
+        root.removeHandler(handler)
+    _queue_handler = QueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    _queue_listener = QueueListener(log_queue, *stream_handlers, respect_handler_level=True)
+    _queue_listener.start()
+
+    if old_handler is not None:
+        root.removeHandler(old_handler)
+    if old_listener is not None:
+        old_listener.stop()  # drains records already queued
+
+
+def _stop_queue_listener() -> None:
+    """Stop the console listener, flushing any queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# Flush pending records before the interpreter exits
+atexit.register(_stop_queue_listener)
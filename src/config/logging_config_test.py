@@ -1,8 +1,37 @@
 """Tests for structured logging configuration module."""
+import atexit
+import io
 import logging
+from logging.handlers import QueueHandler
 
+import pytest
 import structlog
 
+from src.config import logging_config
+
+
+@pytest.fixture
+def console_stream(monkeypatch):
+    """Install a console handler on the root logger writing to a buffer.
+
+    Resets logging_config so configure() routes the handler through a fresh
+    queue. Afterwards the QueueHandler is removed and the listener stopped
+    so its thread does not outlive the test.
+    """
+    root = logging.getLogger()
+    saved_level = root.level
+    stream = io.StringIO()
+    console = logging.StreamHandler(stream)
+    root.addHandler(console)
+    monkeypatch.setattr(logging_config, "_queue_listener", None)
+    monkeypatch.setattr(logging_config, "_queue_handler", None)
+    yield stream
+    logging_config._stop_queue_listener()
+    for handler in root.handlers[:]:
+        if handler is console or isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    root.setLevel(saved_level)
+
 
 class TestConfigureLogging:
     """Tests for the configure() function in logging_config."""
@@ -76,3 +105,53 @@ class TestConfigureLogging:
         # Assert
         root = logging.getLogger()
         assert root.level == logging.ERROR
+
+
+class TestQueueRouting:
+    """Tests for routing console output through a QueueListener."""
+
+    def test_configure_installs_single_queue_handler(self, console_stream):
+        """After configure(), console output goes through exactly one QueueHandler."""
+        # Act
+        logging_config.configure()
+
+        # Assert
+        handlers = logging.getLogger().handlers
+        assert sum(isinstance(h, QueueHandler) for h in handlers) == 1
+        assert not any(type(h) is logging.StreamHandler for h in handlers)
+        assert logging_config._queue_listener is not None
+
+    def test_configure_twice_replaces_and_stops_the_listener(self, console_stream, monkeypatch):
+        """A repeated configure() stops the old listener and registers no new atexit hook."""
+        # Arrange
+        logging_config.configure()
+        first = logging_config._queue_listener
+        assert first is not None
+        register_calls: list[object] = []
+        monkeypatch.setattr(atexit, "register", register_calls.append)
+
+        # Act
+        logging_config.configure()
+        logging.getLogger("queue_test").warning("after reconfigure")
+        logging_config._stop_queue_listener()
+
+        # Assert
+        second_handlers = [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+        assert len(second_handlers) == 1
+        assert first._thread is None  # stopped
+        assert register_calls == []
+        assert "after reconfigure" in console_stream.getvalue()
+
+    def test_records_reach_listener_stream_handler(self, console_stream):
+        """Records logged on the root reach the console handler behind the queue."""
+        # Arrange
+        logging_config.configure(log_level="INFO")
+        listener = logging_config._queue_listener
+        assert listener is not None
+
+        # Act
+        logging.getLogger("queue_test").warning("queued hello")
+        logging_config._stop_queue_listener()  # drains the queue before returning
+
+        # Assert
+        assert "queued hello" in console_stream.getvalue()
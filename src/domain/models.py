@@ -51,9 +51,21 @@ class AIPrompt:
         Returns:
             Concatenated character_registry + surrounding_context + scene_registry + text_to_parse
         """
+        return self.character_registry + self.build_volatile_portion()
+
+    def build_volatile_portion(self) -> str:
+        """Return the part of the dynamic portion that follows the registry.
+
+        The character registry usually stays the same across consecutive
+        sections, while everything after it changes on every call. Providers
+        can use this split to place a second cache breakpoint after the
+        registry.
+
+        Returns:
+            Concatenated surrounding_context + scene_registry + mood_registry + text_to_parse
+        """
         return (
-            self.character_registry
-            + self.surrounding_context
+            self.surrounding_context
             + self.scene_registry
             + self.mood_registry
             + self.text_to_parse
@@ -70,7 +82,7 @@ class AIPrompt:
         return self.build_static_portion() + self.build_dynamic_portion()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Character:
     """A voice character in the audiobook.
 
@@ -82,6 +94,9 @@ class Character:
     ``name`` is the human-readable display name used in prompts and logs.
     ``description`` is an optional voice description for TTS assignment.
     ``is_narrator`` marks the default narration voice.
+
+    Instances are immutable; derive updated copies with
+    ``dataclasses.replace``.
     """
 
     character_id: str
@@ -214,8 +229,16 @@ OPACITY_BY_BEAT_TYPE: dict[BeatType, float] = {
     BeatType.OTHER: 1.0,
 }
 
+# Beat types that are read aloud by the TTS stage.
+_NARRATABLE_BEAT_TYPES = frozenset({
+    BeatType.DIALOGUE,
+    BeatType.NARRATION,
+    BeatType.CHAPTER_ANNOUNCEMENT,
+    BeatType.BOOK_TITLE,
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class Beat:
     """A single piece of text (narration or dialogue).
 
@@ -257,40 +280,35 @@ class Beat:
 
     def is_dialogue(self) -> bool:
         """Return True if beat is dialogue."""
-        return self.beat_type == BeatType.DIALOGUE
+        return self.beat_type is BeatType.DIALOGUE
 
     def is_narration(self) -> bool:
         """Return True if beat is narration."""
-        return self.beat_type == BeatType.NARRATION
+        return self.beat_type is BeatType.NARRATION
 
     def is_illustration(self) -> bool:
         """Return True if beat is an illustration caption."""
-        return self.beat_type == BeatType.ILLUSTRATION
+        return self.beat_type is BeatType.ILLUSTRATION
 
     def is_copyright(self) -> bool:
         """Return True if beat is copyright text."""
-        return self.beat_type == BeatType.COPYRIGHT
+        return self.beat_type is BeatType.COPYRIGHT
 
     def is_other(self) -> bool:
         """Return True if beat is OTHER (non-narratable junk)."""
-        return self.beat_type == BeatType.OTHER
+        return self.beat_type is BeatType.OTHER
 
     def is_chapter_announcement(self) -> bool:
         """Return True if beat is a chapter announcement."""
-        return self.beat_type == BeatType.CHAPTER_ANNOUNCEMENT
+        return self.beat_type is BeatType.CHAPTER_ANNOUNCEMENT
 
     @property
     def is_narratable(self) -> bool:
         """True when the beat should be read aloud (dialogue, narration, or chapter announcement)."""
-        return self.beat_type in {
-            BeatType.DIALOGUE,
-            BeatType.NARRATION,
-            BeatType.CHAPTER_ANNOUNCEMENT,
-            BeatType.BOOK_TITLE,
-        }
+        return self.beat_type in _NARRATABLE_BEAT_TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section (paragraph) of text, optionally broken into beats.
 
@@ -25,6 +25,14 @@ from .models import (
 class TestBeat:
     """Tests for Beat model."""
 
+    def test_beat_has_no_instance_dict(self) -> None:
+        """Slotted Beat instances carry no per-instance __dict__."""
+        # Arrange
+        beat = Beat(text="Hello", beat_type=BeatType.NARRATION)
+
+        # Act / Assert
+        assert not hasattr(beat, "__dict__")
+
     def test_is_illustration_returns_true_for_illustration_type(self) -> None:
         """is_illustration() returns True for ILLUSTRATION beat type."""
         # Arrange
@@ -632,6 +640,36 @@ class TestCharacterRegistry:
         # Assert
         assert len(registry.characters) == 1
 
+    def test_get_sees_characters_appended_directly_to_list(self) -> None:
+        """get() stays correct when the public characters list is edited directly."""
+        # Arrange
+        registry = CharacterRegistry.with_default_narrator()
+        registry.get("narrator")
+        registry.characters.insert(0, Character(character_id="luna", name="Luna Lovegood"))
+
+        # Act / Assert
+        luna = registry.get("luna")
+        narrator = registry.get("narrator")
+        assert luna is not None and luna.name == "Luna Lovegood"
+        assert narrator is not None and narrator.is_narrator
+
+    def test_get_sees_characters_replaced_in_place(self) -> None:
+        """get() and upsert() stay correct after a list slot is overwritten directly."""
+        # Arrange
+        registry = CharacterRegistry.with_default_narrator()
+        registry.get("narrator")
+        registry.characters[0] = Character(character_id="luna", name="Luna Lovegood")
+
+        # Act
+        luna = registry.get("luna")
+        narrator = registry.get("narrator")
+        registry.upsert(Character(character_id="luna", name="Luna"))
+
+        # Assert
+        assert luna is not None and luna.name == "Luna Lovegood"
+        assert narrator is None
+        assert [c.name for c in registry.characters] == ["Luna"]
+
     def test_get_narrator_from_default_registry(self) -> None:
         """get('narrator') works on a registry built with with_default_narrator()."""
         # Arrange
@@ -851,6 +889,14 @@ class TestSectionSectionType:
         content = BookContent(chapters=[chapter])
         return Book(metadata=metadata, content=content)
 
+    def test_section_has_no_instance_dict(self) -> None:
+        """Slotted Section instances carry no per-instance __dict__."""
+        # Arrange
+        section = Section(text="It is a truth universally acknowledged.")
+
+        # Act / Assert
+        assert not hasattr(section, "__dict__")
+
     def test_book_to_dict_serialises_section_type_when_set(self) -> None:
         """Book.to_dict() includes section_type='illustration' for illustration sections."""
         # Arrange
@@ -1086,6 +1132,27 @@ class TestCharacterVoiceDesignPrompt:
         assert char.voice_design_prompt == "adult male, clipped aristocratic baritone."
 
 
+class TestCharacterIsFrozen:
+    """Character is a slotted value object -- updates go through dataclasses.replace."""
+
+    def test_character_is_immutable(self) -> None:
+        """Assigning to a field on a frozen Character raises an error."""
+        # Arrange
+        char = Character(character_id="harry", name="Harry")
+
+        # Act / Assert
+        with pytest.raises(FrozenInstanceError):
+            char.name = "Harry Potter"  # type: ignore[misc]
+
+    def test_character_has_no_instance_dict(self) -> None:
+        """Slotted Character instances carry no per-instance __dict__."""
+        # Arrange
+        char = Character(character_id="harry", name="Harry")
+
+        # Act / Assert
+        assert not hasattr(char, "__dict__")
+
+
 # ── Scene domain model (US-020) ──────────────────────────────────────────────
 
 
@@ -1665,6 +1732,27 @@ class TestAIPromptBuildFullPrompt:
         # Assert
         assert full == static + dynamic
 
+    def test_dynamic_portion_equals_registry_plus_volatile(self) -> None:
+        """build_dynamic_portion() should equal character_registry + build_volatile_portion()."""
+        # Arrange
+        prompt = AIPrompt(
+            static_instructions="S",
+            book_context="B",
+            character_registry="C",
+            surrounding_context="X",
+            scene_registry="E",
+            text_to_parse="T",
+            mood_registry="M",
+        )
+
+        # Act
+        dynamic = prompt.build_dynamic_portion()
+        volatile = prompt.build_volatile_portion()
+
+        # Assert
+        assert volatile == "XEMT"
+        assert dynamic == prompt.character_registry + volatile
+
 
 class TestAIPromptBuildMethodsConsistency:
     """Tests that builder methods are idempotent and consistent."""
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from dataclasses import replace as dc_replace
 from typing import Literal, Optional
 
+import orjson
 import structlog
 
 from src.ai.ai_provider import AIProvider
@@ -24,6 +25,25 @@ from src.parsers.text_sanitizer import sanitize_beat_text
 
 logger = structlog.get_logger(__name__)
 
+# Response token budget for section parsing. Also part of the AI cache key,
+# so generate() and invalidate() must use the same value.
+_MAX_TOKENS = 8192
+
+# Trailing comma before a closing bracket or brace, as emitted by some LLMs.
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+# Insignificant JSON whitespace between concatenated top-level objects.
+_JSON_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+
+
+def _count_unescaped_quotes(text: str) -> int:
+    """Count ``"`` characters not directly preceded by a backslash.
+
+    Equivalent to ``len(re.findall(r'(?<!\\)"', text))`` but uses two
+    C-level substring counts instead of a regex scan.
+    """
+    return text.count('"') - text.count('\\"')
+
 
 @dataclass(frozen=True)
 class MoodAction:
@@ -58,7 +78,7 @@ def _repair_json(text: str) -> str:
         Repaired JSON that can be parsed
     """
     # Remove trailing commas before ] or }
-    text = re.sub(r',\s*([}\]])', r'\1', text)
+    text = _TRAILING_COMMA_RE.sub(r'\1', text)
 
     # Replace literal newlines not inside strings with escaped versions
     lines = text.split('\n')
@@ -73,7 +93,7 @@ def _repair_json(text: str) -> str:
             result_lines[-1] += '\\n' + line
 
         # Count unescaped quotes to track string state
-        unescaped_quotes = len(re.findall(r'(?<!\\)"', line))
+        unescaped_quotes = _count_unescaped_quotes(line)
         if unescaped_quotes % 2 == 1:
             in_string = not in_string
 
@@ -82,7 +102,7 @@ def _repair_json(text: str) -> str:
     # Close any unclosed brackets
     open_braces = text.count('{') - text.count('}')
     open_brackets = text.count('[') - text.count(']')
-    open_quotes = len(re.findall(r'(?<!\\)"', text)) % 2
+    open_quotes = _count_unescaped_quotes(text) % 2
 
     # Close unclosed quotes if needed
     if open_quotes == 1:
@@ -209,7 +229,7 @@ class AISectionParser(BookSectionParser):
         )
         text_preview = section.text[:60].replace("\n", " ")
 
-        response = self.ai_provider.generate(prompt, max_tokens=8192)
+        response = self.ai_provider.generate(prompt, max_tokens=_MAX_TOKENS)
         if not response.strip():
             logger.warning(
                 "ai_section_parser_empty_response",
@@ -223,8 +243,8 @@ class AISectionParser(BookSectionParser):
             # so the caller only receives audio-producible content (dialogue, narration, sound effects).
             beats = [
                 s for s in beats
-                if s.is_narratable or s.beat_type == BeatType.SOUND_EFFECT
-                or s.beat_type == BeatType.VOCAL_EFFECT
+                if s.is_narratable or s.beat_type is BeatType.SOUND_EFFECT
+                or s.beat_type is BeatType.VOCAL_EFFECT
             ]
             self.last_detected_scene = detected_scene
             self.last_detected_mood_action = self._validate_mood_action(
@@ -258,6 +278,8 @@ class AISectionParser(BookSectionParser):
                 error=str(e),
                 text_preview=text_preview,
             )
+            # Don't let a caching provider replay a response we rejected.
+            self.ai_provider.invalidate(prompt, max_tokens=_MAX_TOKENS)
             raise
 
     def _parse_response(
@@ -292,41 +314,14 @@ class AISectionParser(BookSectionParser):
             cleaned = cleaned.strip()
 
             try:
-                data = json.loads(cleaned)
-            except json.JSONDecodeError as first_err:
-                if "Extra data" not in str(first_err):
-                    # Try to repair the JSON before giving up
-                    try:
-                        repaired = _repair_json(cleaned)
-                        data = json.loads(repaired)
-                    except json.JSONDecodeError:
-                        raise first_err
-                else:
-                    # Model appended trailing text or returned multiple JSON objects.
-                    # Extract and merge all valid JSON objects; ignore trailing garbage.
-                    decoder = json.JSONDecoder()
-                    merged: dict = {"beats": [], "new_characters": [], "character_description_updates": []}
-                    pos = 0
-                    found = 0
-                    while pos < len(cleaned):
-                        # Skip whitespace between objects
-                        while pos < len(cleaned) and cleaned[pos] in " \t\n\r":
-                            pos += 1
-                        if pos >= len(cleaned):
-                            break
-                        try:
-                            obj, end = decoder.raw_decode(cleaned, pos)
-                        except json.JSONDecodeError:
-                            break  # Trailing non-JSON content — stop here
-                        found += 1
-                        if isinstance(obj, dict):
-                            merged["beats"].extend(obj.get("beats", []))
-                            merged["new_characters"].extend(obj.get("new_characters", []))
-                            merged["character_description_updates"].extend(
-                                obj.get("character_description_updates", [])
-                            )
-                        pos = end
-                    if found == 0:
+                # Fast path: well-formed responses parse with orjson; anything
+                # else goes through the stdlib decoder and repair logic below.
+                data = orjson.loads(cleaned)
+            except orjson.JSONDecodeError:
+                try:
+                    data = json.loads(cleaned)
+                except json.JSONDecodeError as first_err:
+                    if "Extra data" not in str(first_err):
                         # Try to repair the JSON before giving up
                         try:
                             repaired = _repair_json(cleaned)
@@ -334,7 +329,41 @@ class AISectionParser(BookSectionParser):
                         except json.JSONDecodeError:
                             raise first_err
                     else:
-                        data = merged
+                        # Model appended trailing text or returned multiple JSON objects.
+                        # Extract and merge all valid JSON objects; ignore trailing garbage.
+                        decoder = json.JSONDecoder()
+                        merged: dict = {"beats": [], "new_characters": [], "character_description_updates": []}
+                        pos = 0
+                        found = 0
+                        while pos < len(cleaned):
+                            # raw_decode rejects leading whitespace, so advance the
+                            # index past any whitespace between objects first
+                            whitespace = _JSON_WHITESPACE_RE.match(cleaned, pos)
+                            if whitespace is not None:
+                                pos = whitespace.end()
+                            if pos >= len(cleaned):
+                                break
+                            try:
+                                obj, end = decoder.raw_decode(cleaned, pos)
+                            except json.JSONDecodeError:
+                                break  # Trailing non-JSON content — stop here
+                            found += 1
+                            if isinstance(obj, dict):
+                                merged["beats"].extend(obj.get("beats", []))
+                                merged["new_characters"].extend(obj.get("new_characters", []))
+                                merged["character_description_updates"].extend(
+                                    obj.get("character_description_updates", [])
+                                )
+                            pos = end
+                        if found == 0:
+                            # Try to repair the JSON before giving up
+                            try:
+                                repaired = _repair_json(cleaned)
+                                data = json.loads(repaired)
+                            except json.JSONDecodeError:
+                                raise first_err
+                        else:
+                            data = merged
 
             if not isinstance(data, dict):
                 raise ValueError("Response must be a JSON object with a 'beats' key")
@@ -358,7 +387,7 @@ class AISectionParser(BookSectionParser):
                 # SOUND_EFFECT beats have no character_id (they are not spoken).
                 if beat_type in {BeatType.NARRATION, BeatType.BOOK_TITLE} and speaker is None:
                     character_id: Optional[str] = "narrator"
-                elif beat_type == BeatType.SOUND_EFFECT:
+                elif beat_type is BeatType.SOUND_EFFECT:
                     character_id = None
                 else:
                     character_id = speaker
@@ -4,6 +4,7 @@ from typing import Optional
 import pytest
 
 from src.ai.ai_provider import AIProvider
+from src.ai.caching_ai_provider import CachingAIProvider
 from src.domain.models import (
     AIPrompt,
     Beat,
@@ -149,6 +150,25 @@ class TestAISectionParser:
         assert len(beats) == 1
         assert beats[0].beat_type == BeatType.NARRATION
 
+    def test_parse_merges_concatenated_json_objects(self):
+        # Arrange — model emitted two top-level objects separated by blank lines
+        mock_response = (
+            '{"beats": [{"type": "narration", "text": "It was dark."}], "new_characters": []}'
+            '\n\n  \t'
+            '{"beats": [{"type": "narration", "text": "It was cold."}], "new_characters": []}'
+            '\nTrailing commentary.'
+        )
+        ai_provider = MockAIProvider(mock_response)
+        parser = AISectionParser(ai_provider)
+        section = Section(text='It was dark. It was cold.')
+        registry = self._default_registry()
+
+        # Act
+        beats, _ = parser.parse(section, registry)
+
+        # Assert
+        assert [b.text for b in beats] == ["It was dark.", "It was cold."]
+
     def test_parse_raises_error_on_invalid_json(self):
         # Arrange
         ai_provider = MockAIProvider("not valid json")
@@ -162,6 +182,24 @@ class TestAISectionParser:
         ):
             parser.parse(section, registry)
 
+    def test_parse_failure_evicts_cached_response(self, tmp_path):
+        """A response that fails to parse is not replayed from the AI cache."""
+        # Arrange
+        ai_provider = MockAIProvider("not valid json")
+        caching = CachingAIProvider(ai_provider, cache_dir=tmp_path, ttl_seconds=3600)
+        parser = AISectionParser(caching)
+        section = Section(text='Some text')
+        with pytest.raises(ValueError):
+            parser.parse(section, self._default_registry())
+        ai_provider.response = '{"beats": [], "new_characters": []}'
+
+        # Act
+        beats, _ = parser.parse(section, self._default_registry())
+
+        # Assert
+        assert beats == []
+        assert [p.suffix for p in tmp_path.iterdir()] == [".txt"]
+
     def test_parse_raises_error_on_non_object_response(self):
         """A JSON value that is not an object raises ValueError."""
         # Arrange — a bare JSON number is not an object
@@ -9,7 +9,7 @@ Prompt instructions are loaded from template files in
 share a single source of truth.
 """
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 import structlog
 
@@ -75,14 +75,7 @@ class AnnouncementFormatter:
         Returns:
             Clean spoken text (e.g. "Chapter One. The Beginning.")
         """
-        prompt = AIPrompt(
-            static_instructions=_CHAPTER_ANNOUNCEMENT_INSTRUCTIONS,
-            book_context="",
-            character_registry="",
-            surrounding_context="",
-            scene_registry="",
-            text_to_parse=f"Chapter number: {chapter_number}\nChapter title: {chapter_title}",
-        )
+        prompt = self._chapter_announcement_prompt(chapter_number, chapter_title)
         result = self._ai_provider.generate(prompt, max_tokens=100)
         formatted = result.strip().strip('"').strip("'")
         logger.debug(
@@ -90,3 +83,35 @@ class AnnouncementFormatter:
             chapter_number=chapter_number, chapter_title=chapter_title, formatted=formatted,
         )
         return formatted
+
+    def format_chapter_announcements(
+        self,
+        chapters: Sequence[tuple[int, str]],
+    ) -> list[str]:
+        """Format several chapter headings with concurrent LLM calls.
+
+        Each heading is independent, so the requests are dispatched through
+        ``AIProvider.generate_many`` rather than one round-trip at a time.
+
+        Args:
+            chapters: ``(chapter_number, chapter_title)`` pairs
+
+        Returns:
+            Clean spoken text for each chapter, in input order
+        """
+        prompts = [self._chapter_announcement_prompt(number, title) for number, title in chapters]
+        results = self._ai_provider.generate_many(prompts, max_tokens=100)
+        formatted_all = [result.strip().strip('"').strip("'") for result in results]
+        logger.debug("announcement_formatted_chapters", count=len(formatted_all))
+        return formatted_all
+
+    @staticmethod
+    def _chapter_announcement_prompt(chapter_number: int, chapter_title: str) -> AIPrompt:
+        return AIPrompt(
+            static_instructions=_CHAPTER_ANNOUNCEMENT_INSTRUCTIONS,
+            book_context="",
+            character_registry="",
+            surrounding_context="",
+            scene_registry="",
+            text_to_parse=f"Chapter number: {chapter_number}\nChapter title: {chapter_title}",
+        )
@@ -120,3 +120,19 @@ class TestFormatChapterAnnouncement:
         assert "3" in dynamic
         assert "The Storm" in dynamic
         assert dynamic.strip() != ""
+
+
+class TestFormatChapterAnnouncements:
+    """AnnouncementFormatter.format_chapter_announcements formats in batch."""
+
+    def test_returns_one_stripped_result_per_chapter(self) -> None:
+        """Each chapter gets its own stripped response, in input order."""
+        # Arrange
+        provider = _FakeAIProvider('  "Chapter."  ')
+        formatter = AnnouncementFormatter(provider)
+
+        # Act
+        results = formatter.format_chapter_announcements([(1, "One"), (2, "Two"), (3, "Three")])
+
+        # Assert
+        assert results == ["Chapter.", "Chapter.", "Chapter."]
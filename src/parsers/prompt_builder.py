@@ -22,6 +22,7 @@ from src.domain.models import (
 )
 
 _TEMPLATE_DIR = Path(__file__).parent / "prompts"
+_TEMPLATE_VAR_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
 
 
 def _render_template(template: str, variables: dict[str, object]) -> str:
@@ -34,7 +35,7 @@ def _render_template(template: str, variables: dict[str, object]) -> str:
         var_name = match.group(1).strip()
         return str(variables[var_name])
 
-    return re.sub(r"\{\{\s*(\w+)\s*\}\}", _replace_var, template)
+    return _TEMPLATE_VAR_RE.sub(_replace_var, template)
 
 
 class PromptBuilder:
@@ -69,6 +70,21 @@ class PromptBuilder:
         self.book_author = book_author
         self.context_window = context_window
         self._template = (_TEMPLATE_DIR / "section_parser.prompt").read_text()
+        # The rendered instructions have no per-section inputs, so render
+        # them once here instead of on every build_prompt() call.
+        self._static_instructions = _render_template(self._template, {
+            "type_list": self._build_type_list(),
+            "json_example": self._build_json_example(),
+        })
+        # Book context (title and author) only varies per book.
+        self._book_context = ""
+        if book_title and book_author:
+            self._book_context = (
+                f"\n\nBook context: '{book_title}' "
+                f"by {book_author}"
+            )
+        elif book_title:
+            self._book_context = f"\n\nBook context: '{book_title}'"
 
     def build_prompt(
         self,
@@ -106,21 +122,8 @@ class PromptBuilder:
         Returns:
             An AIPrompt with beated static and dynamic portions.
         """
-        # Render static instructions from template
-        static_instructions = _render_template(self._template, {
-            "type_list": self._build_type_list(),
-            "json_example": self._build_json_example(),
-        })
-
-        # Build book context (title and author, varies per book)
-        book_context = ""
-        if self.book_title and self.book_author:
-            book_context = (
-                f"\n\nBook context: '{self.book_title}' "
-                f"by {self.book_author}"
-            )
-        elif self.book_title:
-            book_context = f"\n\nBook context: '{self.book_title}'"
+        static_instructions = self._static_instructions
+        book_context = self._book_context
 
         # Build character registry (varies per section)
         registry_lines = []
@@ -134,13 +137,7 @@ class PromptBuilder:
 
         # Build surrounding context (varies per section)
         surrounding_context = ""
-        if context_window:
-            # Strip noise-only sections (other/illustration/copyright) so they
-            # don't occupy slots in the window, then cap to the window size.
-            substantive = [s for s in context_window if self._is_substantive(s)]
-            capped = substantive[-self.context_window:] if self.context_window > 0 else []
-        else:
-            capped = []
+        capped = self._select_context_sections(context_window)
         if capped:
             ctx_texts = "\n\n---\n\n".join(
                 self._render_context_section(s) for s in capped
@@ -189,6 +186,27 @@ add them to new_characters if they are not already in the character list above.
             text_to_parse=f"\nText to beat:\n{text}",
         )
 
+    def _select_context_sections(
+        self, context_window: Optional[list[Section]],
+    ) -> list[Section]:
+        """Return the last ``self.context_window`` substantive sections, in order.
+
+        Noise-only sections (other/illustration/copyright) are skipped so they
+        don't occupy slots in the window. The scan walks backwards and stops
+        once the window is full, so the cost is bounded by the window size
+        rather than by how many sections precede the target.
+        """
+        if not context_window or self.context_window <= 0:
+            return []
+        selected: list[Section] = []
+        for section in reversed(context_window):
+            if self._is_substantive(section):
+                selected.append(section)
+                if len(selected) == self.context_window:
+                    break
+        selected.reverse()
+        return selected
+
     @staticmethod
     def _render_mood_registry(
         mood_registry: Optional[MoodRegistry],
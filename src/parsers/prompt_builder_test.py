@@ -1,6 +1,7 @@
 """Tests for PromptBuilder."""
 from src.domain.models import (
     AIPrompt,
+    Beat,
     BeatType,
     Character,
     CharacterRegistry,
@@ -140,6 +141,27 @@ def test_surrounding_context_field_populated_when_context_window_provided():
     assert "Surrounding context" in prompt.surrounding_context
 
 
+def test_surrounding_context_keeps_last_substantive_sections_in_order():
+    """Only the last N substantive sections are included, oldest first."""
+    # Arrange
+    builder = PromptBuilder(context_window=2)
+    registry = CharacterRegistry.with_default_narrator()
+    sections = [
+        Section(text="first", beats=[Beat(text="first", beat_type=BeatType.NARRATION, character_id="narrator")]),
+        Section(text="second", beats=[Beat(text="second", beat_type=BeatType.NARRATION, character_id="narrator")]),
+        Section(text="{3}", beats=[Beat(text="{3}", beat_type=BeatType.OTHER)]),
+        Section(text="third", beats=[Beat(text="third", beat_type=BeatType.NARRATION, character_id="narrator")]),
+    ]
+
+    # Act
+    prompt = builder.build_prompt("Current", registry, context_window=sections)
+
+    # Assert
+    assert "first" not in prompt.surrounding_context
+    assert "{3}" not in prompt.surrounding_context
+    assert prompt.surrounding_context.index("second") < prompt.surrounding_context.index("third")
+
+
 def test_scene_registry_field_populated_when_scene_registry_has_scenes():
     """scene_registry field should be populated when scene_registry contains scenes."""
     # Arrange
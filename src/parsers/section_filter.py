@@ -61,9 +61,12 @@ class SectionFilter:
                 continue
 
             # Tag illustration captions and keep them
+            # The literal '&' check is a cheap prefilter: the caption pattern
+            # requires one, and most prose never contains it.
             if (
                 section.section_type is None
                 and len(stripped) < _ILLUSTRATION_MAX_LEN
+                and "&" in stripped
                 and _ILLUSTRATION_CAPTION_RE.match(stripped)
             ):
                 result.append(Section(
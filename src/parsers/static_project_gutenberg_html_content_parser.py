@@ -48,6 +48,11 @@ _CAPTION_CLASS: str = "caption"
 # that is a descendant of one of these divs is an illustration caption,
 # not prose.
 _ILLUSTRATION_DIV_CLASSES: frozenset[str] = frozenset({"figcenter", "caption"})
+# Runs of whitespace collapsed to a single space in extracted text.
+_WHITESPACE_RE: re.Pattern[str] = re.compile(r'\s+')
+# Tags visited when walking from one chapter heading to the next: ``<p>``
+# elements become sections and ``<h2>`` is where the next chapter starts.
+_SECTION_WALK_TAGS: list[str] = ["p", "h2"]
 
 
 def _is_inside_illustration_block(tag: Tag) -> bool:
@@ -106,12 +111,14 @@ def _extract_text(tag: Tag) -> str:
             for child in node.children:
                 _walk(child, in_emphasis or is_emphasis)  # type: ignore[arg-type]
             if is_emphasis:
-                current = "".join(parts)
-                if current and not current[-1].isspace():
+                # Only the last emitted character matters; look it up instead
+                # of joining everything collected so far on every emphasis tag.
+                last = next((p for p in reversed(parts) if p), "")
+                if last and not last[-1].isspace():
                     parts.append(" ")
 
     _walk(tag, False)
-    return re.sub(r'\s+', ' ', "".join(parts)).strip()
+    return _WHITESPACE_RE.sub(' ', "".join(parts)).strip()
 
 
 def _extract_heading_text(heading: Tag) -> str:
@@ -153,7 +160,7 @@ def _extract_heading_text(heading: Tag) -> str:
 
     raw = "".join(parts)
     # Collapse runs of whitespace (including newlines) to a single space.
-    return re.sub(r'\s+', ' ', raw).strip()
+    return _WHITESPACE_RE.sub(' ', raw).strip()
 
 
 class StaticProjectGutenbergHTMLContentParser(BookContentParser):
@@ -205,7 +212,9 @@ class StaticProjectGutenbergHTMLContentParser(BookContentParser):
         current: Tag | None = start_heading
 
         while current is not None:
-            current = current.find_next()  # type: ignore[assignment]
+            # Only paragraphs and headings matter here; skipping inline tags
+            # avoids stepping through every <em>/<a>/<span> in the chapter.
+            current = current.find_next(_SECTION_WALK_TAGS)  # type: ignore[assignment]
             if current == end_heading:
                 break
             if current is not None and current.name == 'p':
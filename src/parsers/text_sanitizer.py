@@ -7,6 +7,15 @@ odd inflections in TTS output.
 
 import re
 
+# Runs of whitespace, collapsed to a single space.
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Non-terminal: , ; : — – - … · * # @ and Unicode variants
+# Terminal: . ! ? " (never stripped)
+# Matches the whole trailing run of non-terminal punctuation, including any
+# whitespace between the marks, so "went — ," is stripped in one substitution.
+_TRAILING_NON_TERMINAL_RE = re.compile(r'(?:\s*[,;:\u2014\u2013\-\u2026\u00b7\*#@])+$')
+
 
 def sanitize_beat_text(text: str) -> str:
     """Strip trailing non-terminal punctuation and normalise whitespace.
@@ -36,25 +45,8 @@ def sanitize_beat_text(text: str) -> str:
     text = text.strip()
 
     # Step 2: Collapse internal whitespace runs to single space
-    text = re.sub(r'\s+', ' ', text)
-
-    # Step 3: Strip trailing non-terminal punctuation
-    # Repeat until string ends with word character or terminal punctuation
-    # Non-terminal: , ; : — – - … · * # @ and Unicode variants
-    # Terminal: . ! ? "
-    non_terminal_punct = r'[,;:\u2014\u2013\-\u2026\u00b7\*#@]'
-
-    while text:
-        # If ends with terminal punctuation or word character, done
-        if re.search(r'[\w.!?"]$', text):
-            break
-        # If ends with non-terminal punctuation, strip it
-        if re.search(non_terminal_punct + r'$', text):
-            text = re.sub(non_terminal_punct + r'$', '', text)
-            # Strip any trailing whitespace that was behind the punctuation
-            text = text.rstrip()
-        else:
-            # Ends with something else (shouldn't happen, but break to avoid infinite loop)
-            break
-
-    return text
+    text = _WHITESPACE_RE.sub(' ', text)
+
+    # Step 3: Strip trailing non-terminal punctuation, together with any
+    # whitespace behind it, in a single pass
+    return _TRAILING_NON_TERMINAL_RE.sub('', text)
@@ -3,10 +3,10 @@
 Persists a ``Book`` as JSON to ``{base_dir}/{book_id}/book.json``.
 The directory structure is human-browsable (``ls books/``).
 """
-import json
 import os
 from typing import Optional
 
+import orjson
 import structlog
 
 from src.domain.models import Book
@@ -39,8 +39,12 @@ class FileBookRepository(BookRepository):
         os.makedirs(dir_path, exist_ok=True)
 
         file_path = os.path.join(dir_path, self._FILENAME)
-        data = json.dumps(book.to_dict(), indent=2, ensure_ascii=False)
-        with open(file_path, "w", encoding="utf-8") as f:
+        # orjson emits UTF-8 bytes directly, so the (large) document is never
+        # built as a str and then re-encoded on write.
+        data = orjson.dumps(
+            book.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+        with open(file_path, "wb") as f:
             f.write(data)
 
         logger.info("book_saved_to_repository", book_id=book_id, path=file_path)
@@ -55,13 +59,13 @@ class FileBookRepository(BookRepository):
         if not os.path.isfile(file_path):
             return None
 
-        with open(file_path, "r", encoding="utf-8") as f:
+        with open(file_path, "rb") as f:
             content = f.read()
 
         if not content.strip():
             return None
 
-        data = json.loads(content)
+        data = orjson.loads(content)
         logger.info("book_loaded_from_repository", book_id=book_id, path=file_path)
         return Book.from_dict(data)
 
@@ -1,10 +1,25 @@
 """Workflows package for orchestrating book processing pipelines."""
-from src.workflows.ai_workflow import AIProjectGutenbergWorkflow
-from src.workflows.tts_workflow import TTSWorkflow
+from typing import TYPE_CHECKING, Any
+
 from src.workflows.workflow import Workflow
 
+if TYPE_CHECKING:
+    from src.workflows.ai_workflow import AIProjectGutenbergWorkflow
+    from src.workflows.tts_workflow import TTSWorkflow
+
 __all__ = [
     "Workflow",
     "AIProjectGutenbergWorkflow",
     "TTSWorkflow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Concrete workflows pull in heavy dependencies; import them on first use.
+    if name == "AIProjectGutenbergWorkflow":
+        from src.workflows.ai_workflow import AIProjectGutenbergWorkflow
+        return AIProjectGutenbergWorkflow
+    if name == "TTSWorkflow":
+        from src.workflows.tts_workflow import TTSWorkflow
+        return TTSWorkflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
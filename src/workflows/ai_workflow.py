@@ -1,11 +1,13 @@
 """AI-powered Project Gutenberg workflow for downloading and parsing books with section beatation."""
 import bisect
+from pathlib import Path
 from typing import Optional
 
 import structlog
 
 from src.ai.ai_provider import AIProvider
 from src.ai.aws_bedrock_provider import AWSBedrockProvider
+from src.ai.caching_ai_provider import CachingAIProvider
 from src.config.config import Config
 from src.config.feature_flags import FeatureFlags
 from src.domain.models import Beat, BeatType, Book, BookMetadata, Section, SectionRef
@@ -57,8 +59,15 @@ class AIProjectGutenbergWorkflow(Workflow):
     def create(
         cls,
         repository: Optional[BookRepository] = None,
+        ai_cache_dir: Optional[Path] = None,
     ) -> "AIProjectGutenbergWorkflow":
-        """Factory method to create workflow with default dependencies."""
+        """Factory method to create workflow with default dependencies.
+
+        Args:
+            repository: Optional repository used to persist parsed chapters.
+            ai_cache_dir: When set, AI responses are cached in this directory
+                and reused on later runs.
+        """
         downloader = ProjectGutenbergHTMLBookDownloader()
         metadata_parser = StaticProjectGutenbergHTMLMetadataParser()
         content_parser = StaticProjectGutenbergHTMLContentParser()
@@ -76,6 +85,12 @@ class AIProjectGutenbergWorkflow(Workflow):
             ai_provider = AnthropicProvider(config)
         else:
             ai_provider = AWSBedrockProvider(config)
+        if ai_cache_dir is not None:
+            ai_provider = CachingAIProvider(
+                ai_provider,
+                cache_dir=ai_cache_dir,
+                ttl_seconds=config.ai_cache_ttl_days * 86400,
+            )
         section_parser = AISectionParser(ai_provider)
 
         return cls(
@@ -123,12 +138,15 @@ class AIProjectGutenbergWorkflow(Workflow):
         # context. Otherwise, use the provided parser as-is (for testing).
         section_parser: BookSectionParser
         if isinstance(self.section_parser, AISectionParser):
+            ai_provider = self.section_parser.ai_provider
+            if refresh and isinstance(ai_provider, CachingAIProvider):
+                ai_provider = ai_provider.refreshed()
             prompt_builder = PromptBuilder(
                 book_title=book.metadata.title,
                 book_author=book.metadata.author,
             )
             section_parser = AISectionParser(
-                self.section_parser.ai_provider,
+                ai_provider,
                 prompt_builder=prompt_builder
             )
         else:
@@ -146,8 +164,8 @@ class AIProjectGutenbergWorkflow(Workflow):
             # Use LLM-based formatter when a real AI parser is in use,
             # fall back to raw text for tests with fake parsers.
             formatter: Optional[AnnouncementFormatter] = None
-            if isinstance(self.section_parser, AISectionParser):
-                formatter = AnnouncementFormatter(self.section_parser.ai_provider)
+            if isinstance(section_parser, AISectionParser):
+                formatter = AnnouncementFormatter(section_parser.ai_provider)
             self._inject_synthetic_sections(
                 ctx.chapters_to_parse, book.metadata, formatter,
             )
@@ -230,19 +248,19 @@ class AIProjectGutenbergWorkflow(Workflow):
         these sections (no parser call).  Subsequent sections see them in
         their context window naturally.
         """
+        # Announcements are independent of each other, so format them in one
+        # concurrent batch instead of a round-trip per chapter.
+        spoken_anns: Optional[list[str]] = None
+        if formatter and chapters:
+            spoken_anns = formatter.format_chapter_announcements(
+                [(chapter.number, chapter.title) for chapter in chapters],
+            )
+
         for i, chapter in enumerate(chapters):
             # Every chapter gets a chapter announcement
             raw_ann = f"Chapter {chapter.number}. {chapter.title}." if chapter.title else f"Chapter {chapter.number}."
-            spoken_ann = formatter.format_chapter_announcement(chapter.number, chapter.title) if formatter else raw_ann
-            chapter.sections.insert(0, Section(
-                text=raw_ann,
-                section_type="chapter_announcement",
-                beats=[Beat(
-                    text=spoken_ann,
-                    beat_type=BeatType.CHAPTER_ANNOUNCEMENT,
-                    character_id="narrator",
-                )],
-            ))
+            spoken_ann = spoken_anns[i] if spoken_anns is not None else raw_ann
+            synthetic: list[Section] = []
 
             # First chapter also gets a book title announcement before the chapter announcement
             if i == 0:
@@ -250,7 +268,7 @@ class AIProjectGutenbergWorkflow(Workflow):
                 author_part = f", by {metadata.author}" if metadata.author else ""
                 raw_title = f"{title}{author_part}."
                 spoken_title = formatter.format_book_title(title, metadata.author) if formatter else raw_title
-                chapter.sections.insert(0, Section(
+                synthetic.append(Section(
                     text=raw_title,
                     section_type="book_title",
                     beats=[Beat(
@@ -259,3 +277,15 @@ class AIProjectGutenbergWorkflow(Workflow):
                         character_id="narrator",
                     )],
                 ))
+
+            synthetic.append(Section(
+                text=raw_ann,
+                section_type="chapter_announcement",
+                beats=[Beat(
+                    text=spoken_ann,
+                    beat_type=BeatType.CHAPTER_ANNOUNCEMENT,
+                    character_id="narrator",
+                )],
+            ))
+            # One slice assignment shifts the existing sections only once
+            chapter.sections[:0] = synthetic
@@ -1,8 +1,12 @@
 """Unit tests for AIProjectGutenbergWorkflow — US-014 AC3 + US-018 caching."""
+from pathlib import Path
 from typing import Optional
 
+from src.ai.ai_provider import AIProvider
+from src.ai.caching_ai_provider import CachingAIProvider
 from src.config.feature_flags import FeatureFlags
 from src.domain.models import (
+    AIPrompt,
     Beat,
     BeatType,
     Book,
@@ -16,6 +20,7 @@ from src.domain.models import (
     SceneRegistry,
     Section,
 )
+from src.parsers.ai_section_parser import AISectionParser
 from src.parsers.book_section_parser import BookSectionParser
 from src.parsers.book_source import BookSource
 from src.repository.book_repository import BookRepository
@@ -249,6 +254,35 @@ class TestWorkflowReparsesWhenFlagSet:
         assert capturing_parser._call_count == 1
         assert len(repo.save_calls) == 1
 
+    def test_refresh_bypasses_ai_response_cache(self, tmp_path: Path) -> None:
+        """With refresh=True, cached AI responses are regenerated, not replayed."""
+        # Arrange
+        class _CountingAIProvider(AIProvider):
+            calls = 0
+
+            def generate(self, prompt: AIPrompt, max_tokens: int = 1000) -> str:
+                self.calls += 1
+                return '{"beats": [], "new_characters": []}'
+
+        inner = _CountingAIProvider()
+        caching = CachingAIProvider(inner, cache_dir=tmp_path, ttl_seconds=3600)
+
+        def _workflow() -> AIProjectGutenbergWorkflow:
+            chapter = Chapter(number=1, title="Chapter 1", sections=[Section(text="Fresh text.")])
+            return AIProjectGutenbergWorkflow(
+                book_source=_FakeBookSource(chapters_to_parse=[chapter]),
+                section_parser=AISectionParser(caching),
+                repository=_FakeRepository(),
+            )
+
+        _workflow().run(url="http://example.com/test", end_chapter=1, feature_flags=_NO_ANNOUNCER)
+
+        # Act
+        _workflow().run(url="http://example.com/test", end_chapter=1, refresh=True, feature_flags=_NO_ANNOUNCER)
+
+        # Assert
+        assert inner.calls == 2
+
 
 # ── US-020: workflow threads SceneRegistry ────────────────────────────────────
 
@@ -8,7 +8,7 @@ from src.audio.tts.fish_audio_tts_provider import FishAudioTTSProvider
 from src.audio.tts.tts_provider import TTSProvider
 from src.audio.tts.voice_assigner import VoiceAssigner
 from src.config import get_config
-from src.domain.models import Book
+from src.domain.models import Beat, Book, Chapter
 from src.repository.book_repository import BookRepository
 from src.repository.file_book_repository import FileBookRepository
 from src.workflows.workflow import Workflow
@@ -16,6 +16,29 @@ from src.workflows.workflow import Workflow
 logger = structlog.get_logger(__name__)
 
 
+def _plan_chapter_jobs(
+    chapter: Chapter, voice_assignment: dict[str, str],
+) -> list[tuple[Beat, str]]:
+    """Resolve the ``(beat, voice_id)`` synthesis jobs for *chapter*.
+
+    Runs as a separate pass before synthesis so the provider receives the
+    whole chapter at once, in playback order.
+    """
+    jobs: list[tuple[Beat, str]] = []
+    for section in chapter.sections:
+        if section.beats is None:
+            continue
+        for beat in section.beats:
+            if not beat.is_narratable:
+                continue
+            voice_id = voice_assignment.get(beat.character_id or "narrator")
+            if voice_id is None:
+                # Characters without an assigned voice fall back to the narrator
+                voice_id = voice_assignment["narrator"]
+            jobs.append((beat, voice_id))
+    return jobs
+
+
 class TTSWorkflow(Workflow):
     """Staged TTS workflow: load book, assign voices, synthesise per beat.
 
@@ -44,6 +67,8 @@ class TTSWorkflow(Workflow):
         tts_provider = FishAudioTTSProvider(
             api_key=config.require_fish_audio_api_key(),
             books_dir=books_dir,
+            max_workers=config.tts_concurrency,
+            cache_dir=books_dir / "cache" / "tts",
         )
         repository = FileBookRepository(base_dir=str(books_dir))
         voice_assigner = VoiceAssigner(tts_provider)
@@ -89,19 +114,16 @@ class TTSWorkflow(Workflow):
             character_count=len(voice_assignment),
         )
 
+        # Submit the whole book as one batch so a concurrent provider keeps
+        # its pool busy across chapter boundaries instead of draining at the
+        # end of every chapter.
+        jobs: list[tuple[Beat, str]] = []
         for chapter in book.content.chapters:
-            for section in chapter.sections:
-                if section.beats is None:
-                    continue
-                for beat in section.beats:
-                    if not beat.is_narratable:
-                        continue
-                    voice_id = voice_assignment.get(
-                        beat.character_id or "narrator",
-                        voice_assignment["narrator"],
-                    )
-                    duration = self._tts_provider.provide(beat, voice_id, book_id)
-                    beat.duration_seconds = duration
+            jobs.extend(_plan_chapter_jobs(chapter, voice_assignment))
+
+        durations = self._tts_provider.provide_many(jobs, book_id)
+        for (beat, _), duration in zip(jobs, durations):
+            beat.duration_seconds = duration
 
         self._repository.save(book, book_id)
         logger.info("tts_workflow_complete", book_id=book_id)
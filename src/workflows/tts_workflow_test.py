@@ -1,5 +1,6 @@
 """Tests for TTSWorkflow."""
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -18,7 +19,7 @@ from src.domain.models import (
 )
 from src.repository.book_id import generate_book_id
 from src.repository.file_book_repository import FileBookRepository
-from src.workflows.tts_workflow import TTSWorkflow
+from src.workflows.tts_workflow import TTSWorkflow, _plan_chapter_jobs
 
 
 def _make_book() -> Book:
@@ -201,3 +202,48 @@ def test_create_raises_when_api_key_missing(monkeypatch: pytest.MonkeyPatch) ->
     # Act & Assert
     with pytest.raises(ValueError, match="FISH_AUDIO_API_KEY"):
         TTSWorkflow.create()
+
+
+def test_run_submits_all_chapters_in_one_batch(tmp_path: Path) -> None:
+    """TTSWorkflow.run() hands every chapter's beats to a single provide_many call."""
+    # Arrange
+    repository = FileBookRepository(base_dir=str(tmp_path))
+    book = _make_book()
+    book.content.chapters.append(Chapter(number=2, title="Chapter 2", sections=[
+        Section(text="More.", section_type=None, beats=[
+            Beat(text="The end.", beat_type=BeatType.NARRATION, character_id="narrator"),
+        ]),
+    ]))
+    book_id = generate_book_id(book.metadata)
+    repository.save(book, book_id)
+
+    stub_provider = StubTTSProvider(_make_voices())
+    workflow = TTSWorkflow(
+        repository=repository,
+        tts_provider=stub_provider,
+        voice_assigner=VoiceAssigner(stub_provider),
+        books_dir=tmp_path,
+    )
+
+    # Act
+    with patch.object(stub_provider, "provide_many", wraps=stub_provider.provide_many) as spy:
+        workflow.run(book_id=book_id)
+
+    # Assert
+    assert [len(call.args[0]) for call in spy.call_args_list] == [3]
+
+
+def test_plan_chapter_jobs_needs_no_narrator_voice_when_unused() -> None:
+    """A chapter whose beats all have assigned voices plans without a narrator entry."""
+    # Arrange
+    dialogue = Beat(text="Hi.", beat_type=BeatType.DIALOGUE, character_id="harry")
+    chapter = Chapter(number=1, title="Ch1", sections=[
+        Section(text="sfx", beats=[Beat(text="boom", beat_type=BeatType.SOUND_EFFECT)]),
+        Section(text="Hi.", beats=[dialogue]),
+    ])
+
+    # Act
+    jobs = _plan_chapter_jobs(chapter, {"harry": "voice_harry"})
+
+    # Assert
+    assert jobs == [(dialogue, "voice_harry")]
@@ -1,23 +1,25 @@
-"""Workflow factory for creating workflow instances."""
-from pathlib import Path
+"""Workflow factory for creating workflow instances.
 
-from src.repository.file_book_repository import FileBookRepository
+Workflow modules are imported inside their branch so that picking one
+workflow does not pay the import cost (boto3, BeautifulSoup, TTS SDKs)
+of all the others.
+"""
+from pathlib import Path
 
-from .ai_workflow import AIProjectGutenbergWorkflow
-from .ambient_workflow import AmbientWorkflow
-from .mix_workflow import MixWorkflow
-from .music_workflow import MusicWorkflow
-from .sfx_workflow import SfxWorkflow
-from .tts_workflow import TTSWorkflow
 from .workflow import Workflow
 
 
-def create_workflow(workflow_name: str, books_dir: Path = Path("books")) -> Workflow:
+def create_workflow(
+    workflow_name: str,
+    books_dir: Path = Path("books"),
+    ai_cache: bool = True,
+) -> Workflow:
     """Create a workflow instance by name.
 
     Args:
         workflow_name: Name of the workflow to create (ai, tts, ambient, sfx, music, mix)
         books_dir: Base directory for book output (default: books/)
+        ai_cache: Cache AI responses under ``books_dir/cache/ai`` (default: True)
 
     Returns:
         A fully-wired Workflow instance
@@ -26,17 +28,28 @@ def create_workflow(workflow_name: str, books_dir: Path = Path("books")) -> Work
         ValueError: If workflow_name is not recognized
     """
     if workflow_name == "ai":
+        from src.repository.file_book_repository import FileBookRepository
+
+        from .ai_workflow import AIProjectGutenbergWorkflow
         repository = FileBookRepository(base_dir=str(books_dir))
-        return AIProjectGutenbergWorkflow.create(repository=repository)
+        ai_cache_dir = books_dir / "cache" / "ai" if ai_cache else None
+        return AIProjectGutenbergWorkflow.create(
+            repository=repository, ai_cache_dir=ai_cache_dir,
+        )
     elif workflow_name == "tts":
+        from .tts_workflow import TTSWorkflow
         return TTSWorkflow.create(books_dir=books_dir)
     elif workflow_name == "ambient":
+        from .ambient_workflow import AmbientWorkflow
         return AmbientWorkflow.create(books_dir=books_dir)
     elif workflow_name == "sfx":
+        from .sfx_workflow import SfxWorkflow
         return SfxWorkflow.create(books_dir=books_dir)
     elif workflow_name == "music":
+        from .music_workflow import MusicWorkflow
         return MusicWorkflow.create(books_dir=books_dir)
     elif workflow_name == "mix":
+        from .mix_workflow import MixWorkflow
         return MixWorkflow.create(books_dir=books_dir)
     else:
         raise ValueError(f"Unknown workflow: {workflow_name}")